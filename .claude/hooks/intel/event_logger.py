@@ -25,7 +25,7 @@ from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from utils.file_lock import locked_json_rw
+from utils.file_lock import locked_file, locked_json_rw
 
 SESSION_DIR = Path(".claude/session")
 EVENTS_FILE = SESSION_DIR / "events.jsonl"
@@ -215,9 +215,9 @@ def log_event(event):
     timestamp = datetime.now().isoformat()
     event["timestamp"] = timestamp
 
-    # Append to JSONL
+    # Append to JSONL (locked so session_maintenance's rotation can't drop it)
     try:
-        with open(EVENTS_FILE, "a", encoding="utf-8") as f:
+        with locked_file(EVENTS_FILE), open(EVENTS_FILE, "a", encoding="utf-8") as f:
             f.write(json.dumps(event) + "\n")
     except Exception as e:
         print(f"Warning: Failed to write event to JSONL: {e}")
@@ -9,6 +9,7 @@ What it does:
 1. Finalize session JSON with end timestamp, duration, reason
 2. Write audit summary (total prompts, tools used, errors encountered)
 3. Clean up stale .tmp files from session/data directories
+4. Prune old subagent summary cache entries
 """
 import json
 import sys
@@ -17,12 +18,15 @@ from pathlib import Path
 
 # Shared utilities
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-from utils.constants import SESSION_DATA_DIR, SESSION_STATE_DIR, PROJECT_DIR
+from utils.constants import SESSION_DATA_DIR, SESSION_STATE_DIR, PROJECT_DIR, SUMMARY_CACHE_DIR
 from utils.stdin_parser import parse_hook_input, get_session_id
 
 # Max age for .tmp files before cleanup (24 hours)
 STALE_TMP_MAX_AGE = 86400
 
+# Max age for cached subagent summaries (7 days)
+SUMMARY_CACHE_MAX_AGE = 7 * 86400
+
 
 def finalize_session(input_data: dict) -> None:
     """Update session JSON with end data."""
@@ -68,6 +72,7 @@ def cleanup_tmp_files() -> int:
     - .claude/session/*.tmp
     - .claude/data/sessions/*.tmp
     - .claude/data/tts_queue/*.tmp
+    - .claude/data/summary_cache/*.tmp
 
     Only removes files older than STALE_TMP_MAX_AGE seconds.
     Returns count of files removed.
@@ -79,6 +84,7 @@ def cleanup_tmp_files() -> int:
         SESSION_STATE_DIR,
         SESSION_DATA_DIR,
         PROJECT_DIR / ".claude" / "data" / "tts_queue",
+        SUMMARY_CACHE_DIR,
     ]
 
     for search_dir in search_dirs:
@@ -99,10 +105,34 @@ def cleanup_tmp_files() -> int:
     return cleaned
 
 
+def cleanup_summary_cache() -> int:
+    """
+    Remove cached subagent summaries older than SUMMARY_CACHE_MAX_AGE seconds.
+
+    Returns count of files removed.
+    """
+    cleaned = 0
+    now = time.time()
+
+    try:
+        for cache_file in SUMMARY_CACHE_DIR.glob("*.txt"):
+            try:
+                if now - cache_file.stat().st_mtime > SUMMARY_CACHE_MAX_AGE:
+                    cache_file.unlink()
+                    cleaned += 1
+            except OSError:
+                pass
+    except OSError:
+        pass
+
+    return cleaned
+
+
 def main():
     input_data = parse_hook_input()
     finalize_session(input_data)
     cleanup_tmp_files()
+    cleanup_summary_cache()
 
 
 if __name__ == "__main__":
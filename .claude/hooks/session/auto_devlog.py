@@ -18,10 +18,12 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import read_current_session
+
 SESSION_DIR = Path(os.environ.get("CLAUDE_PROJECT_DIR", ".")) / ".claude" / "session"
 SNAPSHOT_FILE = SESSION_DIR / "last_snapshot.json"
 LOCKS_FILE = SESSION_DIR / "task_locks.json"
-SESSION_ID_FILE = SESSION_DIR / "current_session_id.txt"
 DEVLOG_FILE = Path(os.environ.get("CLAUDE_PROJECT_DIR", ".")) / "DEVLOG.md"
 MARKER_FILE = SESSION_DIR / "session_logged.marker"
 
@@ -57,9 +59,7 @@ def was_session_logged():
     try:
         # Use session ID for marker comparison (not date).
         # Previous date-based check failed when two sessions ran on the same day.
-        current_session_id = ""
-        if SESSION_ID_FILE.exists():
-            current_session_id = SESSION_ID_FILE.read_text().strip()
+        current_session_id = read_current_session().get("id", "")
 
         if not current_session_id:
             # Fallback: date-based check if no session ID available
@@ -79,9 +79,7 @@ def mark_session_logged():
         SESSION_DIR.mkdir(parents=True, exist_ok=True)
         # Write session ID to marker instead of just touching the file.
         # This allows per-session detection instead of per-day.
-        session_id = ""
-        if SESSION_ID_FILE.exists():
-            session_id = SESSION_ID_FILE.read_text().strip()
+        session_id = read_current_session().get("id", "")
         MARKER_FILE.write_text(session_id, encoding="utf-8")
     except Exception:
         pass
@@ -152,9 +150,7 @@ def get_claimed_tasks():
 
     try:
         # Get current session ID
-        session_id = None
-        if SESSION_ID_FILE.exists():
-            session_id = SESSION_ID_FILE.read_text().strip()
+        session_id = read_current_session().get("id")
 
         if not session_id:
             return []
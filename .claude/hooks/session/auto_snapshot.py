@@ -10,9 +10,13 @@ Output: .claude/session/last_snapshot.json
 import json
 import os
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import read_current_session
+
 
 def main():
     """Capture and save session snapshot."""
@@ -135,16 +139,13 @@ def get_active_tasks():
 def get_claimed_tasks():
     """Get tasks claimed by this session."""
     locks_file = Path(".claude/session/task_locks.json")
-    session_id_file = Path(".claude/session/current_session_id.txt")
 
     if not locks_file.exists():
         return []
 
     try:
         # Get current session ID
-        session_id = None
-        if session_id_file.exists():
-            session_id = session_id_file.read_text().strip()
+        session_id = read_current_session().get("id")
 
         with open(locks_file, encoding="utf-8") as f:
             locks = json.load(f)
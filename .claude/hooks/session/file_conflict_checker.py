@@ -12,16 +12,16 @@ Output: Blocks operation if file is locked by active session
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import read_current_session
 from utils.file_lock import locked_json_rw
 
 SESSION_DIR = Path(".claude/session")
 FILE_LOCKS_FILE = SESSION_DIR / "file_locks.json"
-SESSION_ID_FILE = SESSION_DIR / "current_session_id.txt"
-SESSION_TAG_FILE = SESSION_DIR / "current_session_tag.txt"
 
 # Lock timeout in seconds (10 minutes)
 LOCK_TIMEOUT_SECONDS = 600
@@ -75,25 +75,12 @@ def main():
 
 def get_session_id():
     """Get current session ID."""
-    if SESSION_ID_FILE.exists():
-        try:
-            return SESSION_ID_FILE.read_text().strip()
-        except Exception:
-            pass
-    return None
+    return read_current_session().get("id")
 
 
 def get_session_tag():
     """Get current session tag."""
-    if SESSION_TAG_FILE.exists():
-        try:
-            stored_data = SESSION_TAG_FILE.read_text().strip()
-            if ":" in stored_data:
-                return stored_data.split(":", 1)[1]
-            return stored_data
-        except Exception:
-            pass
-    return os.environ.get("CLAUDE_SESSION_TAG", "main")
+    return read_current_session().get("tag") or os.environ.get("CLAUDE_SESSION_TAG", "main")
 
 
 def load_file_locks():
@@ -111,7 +98,6 @@ def load_file_locks():
 def check_file_conflict(file_path, session_id):
     """Check if a file is locked by another session."""
     locks = load_file_locks()
-    now = datetime.now()
 
     # Normalize path for comparison
     try:
@@ -126,10 +112,12 @@ def check_file_conflict(file_path, session_id):
     if lock.get("session_id") == session_id:
         return None  # Our own lock
 
-    # Check if lock is stale
+    # Check if lock is stale (numeric timestamp; ISO only for older entries)
     try:
-        lock_time = datetime.fromisoformat(lock.get("last_touched", ""))
-        if (now - lock_time).total_seconds() > LOCK_TIMEOUT_SECONDS:
+        lock_time = lock.get("last_touched_ts")
+        if lock_time is None:
+            lock_time = datetime.fromisoformat(lock.get("last_touched", "")).timestamp()
+        if time.time() - lock_time > LOCK_TIMEOUT_SECONDS:
             return None  # Stale lock, no conflict
     except Exception:
         return None
@@ -144,6 +132,8 @@ def check_file_conflict(file_path, session_id):
 def claim_file(file_path, session_id, session_tag):
     """Claim a file for editing with file locking."""
     now = datetime.now()
+    now_iso = now.isoformat()
+    now_ts = now.timestamp()
 
     try:
         file_key = str(Path(file_path).resolve())
@@ -154,8 +144,10 @@ def claim_file(file_path, session_id, session_tag):
         locks[file_key] = {
             "session_id": session_id,
             "session_tag": session_tag,
-            "claimed_at": now.isoformat(),
-            "last_touched": now.isoformat(),
+            "claimed_at": now_iso,
+            "claimed_at_ts": now_ts,
+            "last_touched": now_iso,
+            "last_touched_ts": now_ts,
             "file_path": file_path
         }
         save(locks)
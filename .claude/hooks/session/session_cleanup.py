@@ -3,27 +3,29 @@
 Session cleanup on Stop.
 
 This Stop hook:
-1. Releases all task claims held by this session
+1. Releases all task claims and file locks held by this session
 2. Removes session from active registry
 3. Logs session summary
 
+Claims, file locks and the registry live in separate files with separate
+locks, so they are released concurrently.
+
 Runs after auto_snapshot.py but before session_maintenance.py.
 """
 import json
 import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import clear_current_session, read_current_session
 from utils.file_lock import locked_json_rw
 
 SESSION_DIR = Path(".claude/session")
 SESSIONS_FILE = SESSION_DIR / "sessions.json"
 LOCKS_FILE = SESSION_DIR / "task_locks.json"
 FILE_LOCKS_FILE = SESSION_DIR / "file_locks.json"
-SESSION_ID_FILE = SESSION_DIR / "current_session_id.txt"
-SESSION_TAG_FILE = SESSION_DIR / "current_session_tag.txt"
 
 
 def main():
@@ -38,14 +40,23 @@ def main():
     sessions = load_sessions()
     session_info = sessions.get(session_id, {})
 
-    # Release all task claims
-    released_task_count = release_all_claims(session_id)
+    # Imported here so the no-session early return stays cheap
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Release all file locks
-    released_file_count = release_all_file_locks(session_id)
+    # Release task claims, file locks and the registry entry concurrently -
+    # each touches a different file under its own lock.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        task_future = executor.submit(release_all_claims, session_id)
+        file_future = executor.submit(release_all_file_locks, session_id)
+        # Sessions already pruned by stale cleanup need no registry lock
+        session_future = None
+        if session_id in sessions:
+            session_future = executor.submit(remove_session, session_id)
 
-    # Remove from session registry
-    remove_session(session_id)
+        released_task_count = task_future.result()
+        released_file_count = file_future.result()
+        if session_future is not None:
+            session_future.result()
 
     # Clear session files
     clear_session_files()
@@ -56,41 +67,48 @@ def main():
 
 def get_session_tag():
     """Get current session tag."""
-    if SESSION_TAG_FILE.exists():
-        try:
-            stored_data = SESSION_TAG_FILE.read_text().strip()
-            if ":" in stored_data:
-                return stored_data.split(":", 1)[1]
-            return stored_data
-        except Exception:
-            pass
-    return os.environ.get("CLAUDE_SESSION_TAG", "main")
+    return read_current_session().get("tag") or os.environ.get("CLAUDE_SESSION_TAG", "main")
 
 
 def get_current_session_id():
     """Get the current session ID."""
-    if SESSION_ID_FILE.exists():
-        try:
-            return SESSION_ID_FILE.read_text().strip()
-        except Exception:
-            pass
-    return os.environ.get("CLAUDE_SESSION_ID")
+    return read_current_session().get("id") or os.environ.get("CLAUDE_SESSION_ID")
 
 
-def load_sessions():
-    """Load sessions registry."""
-    if not SESSIONS_FILE.exists():
-        return {}
+def load_json(path):
+    """Load a JSON registry file (read-only, no locking)."""
     try:
-        with open(SESSIONS_FILE, encoding="utf-8") as f:
+        with open(path, encoding="utf-8") as f:
             return json.load(f)
     except Exception:
         return {}
 
 
+def load_sessions():
+    """Load sessions registry."""
+    return load_json(SESSIONS_FILE)
+
+
+def holds_any(locks, session_id):
+    """Check whether session_id holds any lock."""
+    return any(lock.get("session_id") == session_id for lock in locks.values())
+
+
 def release_all_claims(session_id):
-    """Release all task claims held by this session with file locking."""
-    with locked_json_rw(LOCKS_FILE, default={}) as (locks, save):
+    """
+    Release all task claims held by this session with file locking.
+
+    Every lock is scanned rather than just the session's claimed_tasks: a
+    claim made while the session was missing from the registry is never
+    recorded there.
+
+    An unlocked pre-read skips the exclusive lock when nothing is held; a
+    claim released concurrently in between is harmless (release is idempotent).
+    """
+    if not holds_any(load_json(LOCKS_FILE), session_id):
+        return 0
+
+    with locked_json_rw(LOCKS_FILE, default={}, indent=False) as (locks, save):
         released = []
         for task_id, lock in list(locks.items()):
             if lock.get("session_id") == session_id:
@@ -105,6 +123,10 @@ def release_all_claims(session_id):
 
 def release_all_file_locks(session_id):
     """Release all file locks held by this session with file locking."""
+    # Unlocked pre-read: skip the exclusive lock when nothing is held
+    if not holds_any(load_json(FILE_LOCKS_FILE), session_id):
+        return 0
+
     with locked_json_rw(FILE_LOCKS_FILE, default={}) as (locks, save):
         released = []
         for file_key, lock in list(locks.items()):
@@ -120,25 +142,15 @@ def release_all_file_locks(session_id):
 
 def remove_session(session_id):
     """Remove session from registry with file locking."""
-    with locked_json_rw(SESSIONS_FILE, default={}) as (sessions, save):
+    with locked_json_rw(SESSIONS_FILE, default={}, indent=False) as (sessions, save):
         if session_id in sessions:
             del sessions[session_id]
             save(sessions)
 
 
 def clear_session_files():
-    """Clear session ID and tag files."""
-    try:
-        if SESSION_ID_FILE.exists():
-            SESSION_ID_FILE.unlink()
-    except Exception:
-        pass
-
-    try:
-        if SESSION_TAG_FILE.exists():
-            SESSION_TAG_FILE.unlink()
-    except Exception:
-        pass
+    """Clear the current session file (and legacy ID/tag files)."""
+    clear_current_session()
 
 
 def log_session_summary(session_id, session_tag, session_info, released_task_count, released_file_count):
@@ -150,8 +162,11 @@ def log_session_summary(session_id, session_tag, session_info, released_task_cou
     duration = "unknown"
     if started != "unknown":
         try:
-            start_dt = datetime.fromisoformat(started)
-            duration_sec = (datetime.now() - start_dt).total_seconds()
+            started_ts = session_info.get("started_ts")
+            if started_ts is None:
+                from datetime import datetime
+                started_ts = datetime.fromisoformat(started).timestamp()
+            duration_sec = time.time() - started_ts
             if duration_sec < 60:
                 duration = f"{int(duration_sec)}s"
             elif duration_sec < 3600:
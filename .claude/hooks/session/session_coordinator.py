@@ -13,18 +13,18 @@ Session data stored in: .claude/session/sessions.json
 import json
 import os
 import sys
-import hashlib
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import read_current_session, write_current_session
 from utils.file_lock import locked_json_rw, locked_multi_json_rw
 
 SESSION_DIR = Path(".claude/session")
 SESSIONS_FILE = SESSION_DIR / "sessions.json"
 LOCKS_FILE = SESSION_DIR / "task_locks.json"
 FILE_LOCKS_FILE = SESSION_DIR / "file_locks.json"
-SESSION_TAG_FILE = SESSION_DIR / "current_session_tag.txt"
 
 # Stale threshold in minutes
 STALE_THRESHOLD_MINUTES = 30
@@ -32,6 +32,18 @@ STALE_THRESHOLD_MINUTES = 30
 # Heartbeat interval - session is considered active if updated within this time
 HEARTBEAT_INTERVAL_SECONDS = 60
 
+# A stored session ID issued within this window is reused without a registry check
+SESSION_REUSE_SECONDS = 300
+
+# Sessions seen within this window count as active
+ACTIVE_THRESHOLD_SECONDS = 300
+
+# File locks untouched for longer than this are stale
+FILE_LOCK_STALE_SECONDS = 600
+
+# Resolved file-lock keys, keyed by the caller's raw path (process-local)
+_RESOLVE_CACHE: dict[str, str] = {}
+
 
 def main():
     """Register session heartbeat and check for conflicts."""
@@ -66,31 +78,36 @@ def get_session_id():
     pid = os.getpid()
     ppid = os.getppid()
 
-    # Check for existing session ID file (persists across tool calls)
-    id_file = SESSION_DIR / "current_session_id.txt"
+    # Check for existing session file (persists across tool calls)
+    current = read_current_session()
+    stored_id = current.get("id")
+
+    if stored_id:
+        # Recently issued ID - same session, no registry parse needed
+        if time.time() - current.get("issued_ts", 0) < SESSION_REUSE_SECONDS:
+            return stored_id
 
-    if id_file.exists():
         try:
-            stored_id = id_file.read_text().strip()
             # Validate it's still our session (check timestamp)
             sessions = load_sessions()
             if stored_id in sessions:
-                session = sessions[stored_id]
-                last_seen = datetime.fromisoformat(session.get("last_seen", ""))
+                last_seen = entry_timestamp(sessions[stored_id], "last_seen")
                 # If seen within last 5 minutes, same session
-                if (datetime.now() - last_seen).total_seconds() < 300:
+                if last_seen is not None and time.time() - last_seen < SESSION_REUSE_SECONDS:
+                    write_current_session(stored_id, current.get("tag"))
                     return stored_id
         except Exception:
             pass
 
-    # Generate new session ID
+    # Generate new session ID (hashlib is only needed on this path)
+    import hashlib
     timestamp = datetime.now().isoformat()
     raw = f"{pid}-{ppid}-{timestamp}"
     session_id = hashlib.sha256(raw.encode()).hexdigest()[:12]
 
     # Persist for this session
     try:
-        id_file.write_text(session_id)
+        write_current_session(session_id)
     except Exception:
         pass
 
@@ -106,16 +123,9 @@ def get_or_generate_session_tag(session_id):
         return env_tag
 
     # Check if we already have a tag for this session
-    if SESSION_TAG_FILE.exists():
-        try:
-            stored_data = SESSION_TAG_FILE.read_text().strip()
-            # Format: session_id:tag
-            if ":" in stored_data:
-                stored_id, stored_tag = stored_data.split(":", 1)
-                if stored_id == session_id:
-                    return stored_tag
-        except Exception:
-            pass
+    current = read_current_session()
+    if current.get("id") == session_id and current.get("tag"):
+        return current["tag"]
 
     # Generate a unique worker tag based on active sessions
     sessions = load_sessions()
@@ -140,7 +150,7 @@ def get_or_generate_session_tag(session_id):
 
     # Persist for this session
     try:
-        SESSION_TAG_FILE.write_text(f"{session_id}:{new_tag}")
+        write_current_session(session_id, new_tag)
     except Exception:
         pass
 
@@ -150,9 +160,6 @@ def get_or_generate_session_tag(session_id):
 
 def load_sessions():
     """Load active sessions registry."""
-    if not SESSIONS_FILE.exists():
-        return {}
-
     try:
         with open(SESSIONS_FILE, encoding="utf-8") as f:
             return json.load(f)
@@ -160,17 +167,38 @@ def load_sessions():
         return {}
 
 
+def entry_timestamp(entry, field):
+    """
+    Get entry[field] as epoch seconds, or None if missing/unparseable.
+
+    Prefers the numeric "<field>_ts" companion; ISO strings are only parsed
+    for entries written before those were recorded.
+    """
+    ts = entry.get(f"{field}_ts")
+    if ts is not None:
+        return ts
+    try:
+        return datetime.fromisoformat(entry.get(field, "")).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
 def register_session(session_id, session_tag):
     """Register or update session heartbeat with file locking."""
-    with locked_json_rw(SESSIONS_FILE, default={}) as (sessions, save):
-        now = datetime.now().isoformat()
+    with locked_json_rw(SESSIONS_FILE, default={}, indent=False) as (sessions, save):
+        # One clock read shared by the ISO string and the numeric timestamp
+        now_dt = datetime.now()
+        now = now_dt.isoformat()
+        now_ts = now_dt.timestamp()
 
         if session_id not in sessions:
             # New session
             sessions[session_id] = {
                 "tag": session_tag,
                 "started": now,
+                "started_ts": now_ts,
                 "last_seen": now,
+                "last_seen_ts": now_ts,
                 "tool_count": 1,
                 "claimed_tasks": []
             }
@@ -178,6 +206,7 @@ def register_session(session_id, session_tag):
         else:
             # Update heartbeat
             sessions[session_id]["last_seen"] = now
+            sessions[session_id]["last_seen_ts"] = now_ts
             sessions[session_id]["tool_count"] = sessions[session_id].get("tool_count", 0) + 1
 
         save(sessions)
@@ -186,22 +215,18 @@ def register_session(session_id, session_tag):
 def cleanup_stale_sessions():
     """Remove sessions with no activity for >30 minutes. Uses multi-file lock."""
     with locked_multi_json_rw(
-        (SESSIONS_FILE, {}), (LOCKS_FILE, {})
+        (SESSIONS_FILE, {}), (LOCKS_FILE, {}), indent=False
     ) as entries:
         sessions, save_sessions_fn = entries[0]
         locks, save_locks_fn = entries[1]
 
-        now = datetime.now()
-        stale_threshold = timedelta(minutes=STALE_THRESHOLD_MINUTES)
+        cutoff = time.time() - STALE_THRESHOLD_MINUTES * 60
 
         stale_ids = []
         for session_id, session in sessions.items():
-            try:
-                last_seen = datetime.fromisoformat(session.get("last_seen", ""))
-                if now - last_seen > stale_threshold:
-                    stale_ids.append(session_id)
-            except Exception:
-                pass
+            last_seen = entry_timestamp(session, "last_seen")
+            if last_seen is not None and last_seen < cutoff:
+                stale_ids.append(session_id)
 
         if not stale_ids:
             return
@@ -230,7 +255,7 @@ def cleanup_stale_sessions():
 
 def release_task_claims(session_id, task_ids):
     """Release task claims held by a session with file locking."""
-    with locked_json_rw(LOCKS_FILE, default={}) as (locks, save):
+    with locked_json_rw(LOCKS_FILE, default={}, indent=False) as (locks, save):
         changed = False
         for task_id in task_ids:
             if task_id in locks:
@@ -243,9 +268,6 @@ def release_task_claims(session_id, task_ids):
 
 def load_locks():
     """Load task locks (read-only, no locking needed)."""
-    if not LOCKS_FILE.exists():
-        return {}
-
     try:
         with open(LOCKS_FILE, encoding="utf-8") as f:
             return json.load(f)
@@ -258,19 +280,15 @@ def check_conflicts(current_session_id):
     sessions = load_sessions()
 
     # Filter to active sessions (seen in last 5 minutes)
-    now = datetime.now()
-    active_threshold = timedelta(minutes=5)
+    cutoff = time.time() - ACTIVE_THRESHOLD_SECONDS
 
     active_sessions = []
     for session_id, session in sessions.items():
         if session_id == current_session_id:
             continue
-        try:
-            last_seen = datetime.fromisoformat(session.get("last_seen", ""))
-            if now - last_seen < active_threshold:
-                active_sessions.append(session)
-        except Exception:
-            pass
+        last_seen = entry_timestamp(session, "last_seen")
+        if last_seen is not None and last_seen > cutoff:
+            active_sessions.append(session)
 
     if active_sessions:
         tags = [s.get("tag", "unknown") for s in active_sessions]
@@ -280,33 +298,34 @@ def check_conflicts(current_session_id):
 def get_active_sessions():
     """Get list of currently active sessions (utility function)."""
     sessions = load_sessions()
-    now = datetime.now()
-    active_threshold = timedelta(minutes=5)
+    cutoff = time.time() - ACTIVE_THRESHOLD_SECONDS
 
     active = []
     for session_id, session in sessions.items():
-        try:
-            last_seen = datetime.fromisoformat(session.get("last_seen", ""))
-            if now - last_seen < active_threshold:
-                active.append({
-                    "id": session_id,
-                    "tag": session.get("tag"),
-                    "last_seen": session.get("last_seen"),
-                    "claimed_tasks": session.get("claimed_tasks", [])
-                })
-        except Exception:
-            pass
+        last_seen = entry_timestamp(session, "last_seen")
+        if last_seen is not None and last_seen > cutoff:
+            active.append({
+                "id": session_id,
+                "tag": session.get("tag"),
+                "last_seen": session.get("last_seen"),
+                "claimed_tasks": session.get("claimed_tasks", [])
+            })
 
     return active
 
 
 # ============ File Lock Functions ============
 
+def _file_key(file_path):
+    """Normalize a file path into a lock key, resolving each path only once."""
+    key = _RESOLVE_CACHE.get(file_path)
+    if key is None:
+        key = _RESOLVE_CACHE[file_path] = str(Path(file_path).resolve())
+    return key
+
+
 def load_file_locks():
     """Load file locks registry."""
-    if not FILE_LOCKS_FILE.exists():
-        return {}
-
     try:
         with open(FILE_LOCKS_FILE, encoding="utf-8") as f:
             return json.load(f)
@@ -317,7 +336,9 @@ def load_file_locks():
 def claim_file(file_path, session_id, session_tag):
     """Claim a file for editing with file locking. Returns (success, conflict_info)."""
     now = datetime.now()
-    file_key = str(Path(file_path).resolve())
+    now_iso = now.isoformat()
+    now_ts = now.timestamp()
+    file_key = _file_key(file_path)
 
     with locked_json_rw(FILE_LOCKS_FILE, default={}) as (locks, save):
         if file_key in locks:
@@ -327,32 +348,29 @@ def claim_file(file_path, session_id, session_tag):
             # Check if it's our own lock
             if lock_session == session_id:
                 # Update timestamp
-                locks[file_key]["last_touched"] = now.isoformat()
+                locks[file_key]["last_touched"] = now_iso
+                locks[file_key]["last_touched_ts"] = now_ts
                 save(locks)
                 return True, None
 
-            # Check if lock is stale (>10 minutes)
-            try:
-                lock_time = datetime.fromisoformat(lock.get("last_touched", ""))
-                if (now - lock_time).total_seconds() > 600:
-                    # Stale lock, we can take over
-                    pass
-                else:
-                    # Active conflict
-                    return False, {
-                        "file": file_path,
-                        "held_by": lock.get("session_tag", "unknown"),
-                        "since": lock.get("claimed_at", "unknown")
-                    }
-            except Exception:
-                pass
+            # Check if lock is stale (>10 minutes); stale locks can be taken over
+            lock_time = entry_timestamp(lock, "last_touched")
+            if lock_time is not None and now_ts - lock_time <= FILE_LOCK_STALE_SECONDS:
+                # Active conflict
+                return False, {
+                    "file": file_path,
+                    "held_by": lock.get("session_tag", "unknown"),
+                    "since": lock.get("claimed_at", "unknown")
+                }
 
         # Claim the file
         locks[file_key] = {
             "session_id": session_id,
             "session_tag": session_tag,
-            "claimed_at": now.isoformat(),
-            "last_touched": now.isoformat(),
+            "claimed_at": now_iso,
+            "claimed_at_ts": now_ts,
+            "last_touched": now_iso,
+            "last_touched_ts": now_ts,
             "file_path": file_path
         }
         save(locks)
@@ -361,7 +379,7 @@ def claim_file(file_path, session_id, session_tag):
 
 def release_file(file_path, session_id):
     """Release a file lock with file locking."""
-    file_key = str(Path(file_path).resolve())
+    file_key = _file_key(file_path)
 
     with locked_json_rw(FILE_LOCKS_FILE, default={}) as (locks, save):
         if file_key in locks:
@@ -401,8 +419,7 @@ def get_file_locks_for_session(session_id):
 def check_file_conflict(file_path, session_id):
     """Check if a file is locked by another session."""
     locks = load_file_locks()
-    file_key = str(Path(file_path).resolve())
-    now = datetime.now()
+    file_key = _file_key(file_path)
 
     if file_key not in locks:
         return None
@@ -412,12 +429,9 @@ def check_file_conflict(file_path, session_id):
         return None
 
     # Check if lock is stale
-    try:
-        lock_time = datetime.fromisoformat(lock.get("last_touched", ""))
-        if (now - lock_time).total_seconds() > 600:
-            return None  # Stale, no conflict
-    except Exception:
-        return None
+    lock_time = entry_timestamp(lock, "last_touched")
+    if lock_time is None or time.time() - lock_time > FILE_LOCK_STALE_SECONDS:
+        return None  # Stale, no conflict
 
     return {
         "file": file_path,
@@ -8,19 +8,30 @@ Runs automatically when Claude session ends to:
 
 This keeps session files manageable without manual intervention.
 """
-import json
+import mmap
 import os
 import re
 import sys
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.file_lock import locked_file
+
 # Configuration
 ARCHIVE_DAYS = 30
 SESSION_DIR = Path(".claude/session")
 EVENTS_FILE = SESSION_DIR / "events.jsonl"
 EVENTS_ARCHIVE = SESSION_DIR / "events_archive.jsonl"
 
+# Session headers in STATE.md "## Session Log" and DEVLOG.md "## Recent Sessions"
+STATE_SESSION_RE = re.compile(r"^### (\d{4}-\d{2}-\d{2})", re.MULTILINE)
+DEVLOG_SESSION_RE = re.compile(r"^### Session: (\d{4}-\d{2}-\d{2})", re.MULTILINE)
+
+# Top-level event timestamp; log_event() sets it last, so it is the final key
+EVENT_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"([^"]*)"')
+
 
 def main():
     """Run all maintenance tasks."""
@@ -62,60 +73,18 @@ def archive_state_sessions(cutoff_date):
     except Exception:
         return 0
 
-    # Find Session Log section
-    session_log_match = re.search(
-        r"(## Session Log\n)(.*?)(?=\n## |\Z)",
-        content,
-        re.DOTALL
+    new_content, archive_sessions = split_old_sessions(
+        content, "## Session Log\n", STATE_SESSION_RE, cutoff_date
     )
 
-    if not session_log_match:
-        return 0
-
-    session_log_header = session_log_match.group(1)
-    session_log_content = session_log_match.group(2)
-
-    # Parse individual sessions
-    session_pattern = r"(### \d{4}-\d{2}-\d{2}.*?)(?=\n### \d{4}-\d{2}-\d{2}|\Z)"
-    sessions = re.findall(session_pattern, session_log_content, re.DOTALL)
-
-    keep_sessions = []
-    archive_sessions = []
-
-    for session in sessions:
-        date_match = re.match(r"### (\d{4}-\d{2}-\d{2})", session)
-        if date_match:
-            try:
-                session_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                if session_date < cutoff_date:
-                    archive_sessions.append(session)
-                else:
-                    keep_sessions.append(session)
-            except ValueError:
-                keep_sessions.append(session)
-        else:
-            keep_sessions.append(session)
-
     if not archive_sessions:
         return 0
 
     # Write archived sessions
     try:
-        archive_content = ""
-        if archive_file.exists():
-            archive_content = archive_file.read_text(encoding="utf-8", errors="replace")
-            if not archive_content.endswith("\n\n"):
-                archive_content += "\n\n"
-
-        if not archive_content:
-            archive_content = f"# STATE.md Archive\n\nSessions archived on {datetime.now().strftime('%Y-%m-%d')}\n\n---\n\n"
-
-        archive_content += "\n".join(archive_sessions)
-        archive_file.write_text(archive_content, encoding="utf-8")
+        append_to_archive(archive_file, "STATE.md", archive_sessions)
 
         # Update STATE.md
-        new_session_log = session_log_header + "\n".join(keep_sessions)
-        new_content = content[:session_log_match.start()] + new_session_log + content[session_log_match.end():]
         state_file.write_text(new_content, encoding="utf-8")
 
         return len(archive_sessions)
@@ -137,122 +106,203 @@ def archive_devlog_sessions(cutoff_date):
     except Exception:
         return 0
 
-    # Find Recent Sessions section
-    sessions_match = re.search(
-        r"(## Recent Sessions\n)(.*?)(?=\n## |\Z)",
-        content,
-        re.DOTALL
+    new_content, archive_sessions = split_old_sessions(
+        content, "## Recent Sessions\n", DEVLOG_SESSION_RE, cutoff_date
     )
 
-    if not sessions_match:
+    if not archive_sessions:
         return 0
 
-    sessions_header = sessions_match.group(1)
-    sessions_content = sessions_match.group(2)
+    # Write archived sessions
+    try:
+        append_to_archive(archive_file, "DEVLOG.md", archive_sessions)
+
+        # Update DEVLOG.md
+        devlog_file.write_text(new_content, encoding="utf-8")
+
+        return len(archive_sessions)
+    except Exception as e:
+        print(f"Warning: Failed to archive DEVLOG sessions: {e}")
+        return 0
+
+
+def split_old_sessions(content, section_header, session_re, cutoff_date):
+    """
+    Remove sessions older than cutoff_date from a markdown section.
+
+    Session boundaries come from a single pass of session_re over the section;
+    each session runs up to the line before the next session header. Any text
+    between the section header and the first session is kept.
+
+    Returns (new_content, archive_sessions). archive_sessions is empty (and
+    content unchanged) when nothing is old enough to archive.
+    """
+    section_start = content.find(section_header)
+    if section_start == -1:
+        return content, []
 
-    # Parse individual sessions
-    session_pattern = r"(### Session: \d{4}-\d{2}-\d{2}.*?)(?=\n### Session: \d{4}-\d{2}-\d{2}|\Z)"
-    sessions = re.findall(session_pattern, sessions_content, re.DOTALL)
+    body_start = section_start + len(section_header)
+    section_end = content.find("\n## ", body_start)
+    if section_end == -1:
+        section_end = len(content)
+
+    matches = list(session_re.finditer(content, body_start, section_end))
 
     keep_sessions = []
     archive_sessions = []
 
-    for session in sessions:
-        date_match = re.match(r"### Session: (\d{4}-\d{2}-\d{2})", session)
-        if date_match:
-            try:
-                session_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
-                if session_date < cutoff_date:
-                    archive_sessions.append(session)
-                else:
-                    keep_sessions.append(session)
-            except ValueError:
-                keep_sessions.append(session)
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() - 1 if i + 1 < len(matches) else section_end
+        session = content[match.start():end]
+        try:
+            is_old = datetime.strptime(match.group(1), "%Y-%m-%d") < cutoff_date
+        except ValueError:
+            is_old = False
+
+        if is_old:
+            archive_sessions.append(session)
         else:
             keep_sessions.append(session)
 
     if not archive_sessions:
-        return 0
+        return content, []
 
-    # Write archived sessions
-    try:
-        archive_content = ""
-        if archive_file.exists():
-            archive_content = archive_file.read_text(encoding="utf-8", errors="replace")
-            if not archive_content.endswith("\n\n"):
-                archive_content += "\n\n"
+    preamble = content[body_start:matches[0].start()]
+    new_content = (
+        content[:body_start] + preamble + "\n".join(keep_sessions) + content[section_end:]
+    )
+    return new_content, archive_sessions
 
-        if not archive_content:
-            archive_content = f"# DEVLOG.md Archive\n\nSessions archived on {datetime.now().strftime('%Y-%m-%d')}\n\n---\n\n"
 
-        archive_content += "\n".join(archive_sessions)
-        archive_file.write_text(archive_content, encoding="utf-8")
+def append_to_archive(archive_file, source_name, archive_sessions):
+    """
+    Append archived sessions to an *_ARCHIVE.md file.
 
-        # Update DEVLOG.md
-        new_sessions = sessions_header + "\n".join(keep_sessions)
-        new_content = content[:sessions_match.start()] + new_sessions + content[sessions_match.end():]
-        devlog_file.write_text(new_content, encoding="utf-8")
-
-        return len(archive_sessions)
-    except Exception as e:
-        print(f"Warning: Failed to archive DEVLOG sessions: {e}")
-        return 0
+    Only the tail of an existing archive is read to decide whether a blank-line
+    separator is needed, so appending cost doesn't grow with the archive.
+    """
+    try:
+        with open(archive_file, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(size - 4, 0))
+            tail = f.read().replace(b"\r\n", b"\n")
+    except FileNotFoundError:
+        size = 0
+        tail = b""
+
+    with open(archive_file, "a", encoding="utf-8") as f:
+        if size == 0:
+            f.write(f"# {source_name} Archive\n\nSessions archived on {datetime.now().strftime('%Y-%m-%d')}\n\n---\n\n")
+        elif not tail.endswith(b"\n\n"):
+            f.write("\n\n")
+        f.write("\n".join(archive_sessions))
 
 
 def rotate_events():
-    """Archive events older than ARCHIVE_DAYS from events.jsonl."""
-    if not EVENTS_FILE.exists():
-        return 0
-
+    """
+    Archive events older than ARCHIVE_DAYS from events.jsonl.
+
+    Events are appended in timestamp order, so the scan stops at the first
+    recent event and the tail from there is kept as-is instead of being
+    parsed and rewritten line by line. Lines without a readable timestamp
+    are kept in place and skipped over.
+
+    The file is memory-mapped and walked with byte-level newline searches, so
+    no per-line str objects or JSON parses are needed to find the cutoff.
+    Rotation holds the lock log_event() appends under, and the kept lines
+    replace events.jsonl via a temp file, so no append is lost and a crash
+    leaves either the old or the new file.
+    """
     cutoff_date = datetime.now() - timedelta(days=ARCHIVE_DAYS)
 
     try:
-        keep_events = []
-        archive_events = []
-
-        with open(EVENTS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    event = json.loads(line)
-                    timestamp = event.get("timestamp", "")
-
-                    # Parse timestamp
-                    try:
-                        # Python 3.11+ fromisoformat handles timezone-aware strings
-                        event_date = datetime.fromisoformat(timestamp)
-                        # Make timezone-naive for comparison
-                        if event_date.tzinfo is not None:
-                            event_date = event_date.replace(tzinfo=None)
-
-                        if event_date < cutoff_date:
-                            archive_events.append(line)
-                        else:
-                            keep_events.append(line)
-                    except ValueError:
-                        keep_events.append(line)  # Keep if can't parse
-                except json.JSONDecodeError:
-                    keep_events.append(line)  # Keep malformed lines
-
-        if not archive_events:
-            return 0
-
-        # Append to archive
-        with open(EVENTS_ARCHIVE, "a", encoding="utf-8") as f:
-            for line in archive_events:
-                f.write(line if line.endswith("\n") else line + "\n")
-
-        # Rewrite events file with only recent events
-        with open(EVENTS_FILE, "w", encoding="utf-8") as f:
-            for line in keep_events:
-                f.write(line if line.endswith("\n") else line + "\n")
-
-        return len(archive_events)
+        with locked_file(EVENTS_FILE):
+            return _rotate_events_locked(cutoff_date)
+    except FileNotFoundError:
+        return 0
     except Exception as e:
         print(f"Warning: Failed to rotate events: {e}")
         return 0
 
 
+def _rotate_events_locked(cutoff_date):
+    """Archive the old events; caller holds the events.jsonl lock."""
+    archive_events = []
+    kept_lines = []  # Unparsable lines ahead of the cutoff stay in the file
+    cutoff_offset = 0
+
+    with open(EVENTS_FILE, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return 0  # mmap can't map an empty file
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            while cutoff_offset < size:
+                newline = mm.find(b"\n", cutoff_offset)
+                line_end = size if newline == -1 else newline + 1
+                line = mm[cutoff_offset:line_end]
+                if line.strip():
+                    event_date = event_timestamp(line)
+                    if event_date is None:
+                        kept_lines.append(line)
+                    elif event_date < cutoff_date:
+                        archive_events.append(line)
+                    else:
+                        break
+                cutoff_offset = line_end
+
+            if not archive_events:
+                return 0
+            remaining = b"".join(kept_lines) + mm[cutoff_offset:]
+
+    # Stage the kept lines before touching the archive, so a failed temp write
+    # archives nothing. The archive is appended before the replace: if the
+    # replace then fails (on Windows, while a reader has events.jsonl open),
+    # the events stay in both files and are archived again next rotation - a
+    # duplicate in the archive rather than a lost event.
+    fd, temp_path = tempfile.mkstemp(dir=EVENTS_FILE.parent, prefix=".events.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(remaining)
+
+        # Append to archive in a single write
+        if not archive_events[-1].endswith(b"\n"):
+            archive_events[-1] += b"\n"
+        with open(EVENTS_ARCHIVE, "ab") as f:
+            f.write(b"".join(archive_events))
+
+        os.replace(temp_path, EVENTS_FILE)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+    return len(archive_events)
+
+
+def event_timestamp(line):
+    """
+    Get the naive timestamp of a raw JSONL event line, or None if unreadable.
+
+    The timestamp is pulled straight from the bytes instead of parsing the
+    whole event. The last "timestamp" key is used so a nested one in
+    "details" can't shadow the top-level value.
+    """
+    match = EVENT_TIMESTAMP_RE.match(line, line.rfind(b'"timestamp"'))
+    if not match:
+        return None  # Malformed line
+
+    try:
+        # Python 3.11+ fromisoformat handles timezone-aware strings
+        event_date = datetime.fromisoformat(match.group(1).decode("ascii"))
+    except ValueError:
+        return None
+
+    # Make timezone-naive for comparison
+    if event_date.tzinfo is not None:
+        event_date = event_date.replace(tzinfo=None)
+
+    return event_date
+
+
 if __name__ == "__main__":
     main()
@@ -13,40 +13,38 @@ Exit codes:
   1 - Warning (logged but not blocking)
   2 - Blocked (conflict detected)
 """
-import json
+import hashlib
 import os
-import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.current_session import read_current_session
 from utils.file_lock import locked_multi_json_rw
+from utils.json_compat import JSONDecodeError, loads
 
 SESSION_DIR = Path(".claude/session")
 LOCKS_FILE = SESSION_DIR / "task_locks.json"
 SESSIONS_FILE = SESSION_DIR / "sessions.json"
-SESSION_TAG_FILE = SESSION_DIR / "current_session_tag.txt"
 
 # Set to True to block conflicting operations instead of just warning
 STRICT_MODE = False
 
+# Todo statuses that claim or release a task; pending todos are ignored
+CLAIM_STATUSES = frozenset({"in_progress", "completed"})
+
 
 def main():
     """Validate task operations and enforce claiming rules."""
-    SESSION_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Get current session info
-    session_id = get_current_session_id()
-    session_tag = get_current_session_tag()
-
-    # Parse tool input from stdin
+    # Parse tool input first - most invocations exit before touching session files
     try:
-        stdin_data = sys.stdin.read()
+        # Raw bytes go straight to the parser without a text decode
+        stdin_data = sys.stdin.buffer.read()
         if not stdin_data:
             return
 
-        data = json.loads(stdin_data)
+        data = loads(stdin_data)
         tool_name = data.get("tool_name", "")
 
         # Only process TodoWrite
@@ -54,15 +52,20 @@ def main():
             return
 
         tool_input = data.get("tool_input", {})
-        todos = tool_input.get("todos", [])
-
+        # Pending todos never touch claims, so drop them before any hashing;
+        # pending-only updates (adding/reordering todos) exit here
+        todos = [todo for todo in tool_input.get("todos", []) if todo.get("status") in CLAIM_STATUSES]
         if not todos:
             return
 
+        # Get current session info
+        session_id = get_current_session_id()
+        session_tag = get_current_session_tag()
+
         # Validate each task change
         validate_task_changes(todos, session_id, session_tag)
 
-    except json.JSONDecodeError:
+    except JSONDecodeError:
         pass
     except Exception as e:
         print(f"Warning: Task validation error: {e}")
@@ -70,109 +73,43 @@ def main():
 
 def get_current_session_id():
     """Get the current session ID."""
-    # Try from file first
-    id_file = SESSION_DIR / "current_session_id.txt"
-    if id_file.exists():
-        try:
-            return id_file.read_text().strip()
-        except Exception:
-            pass
-
-    # Fallback to environment
-    return os.environ.get("CLAUDE_SESSION_ID", "unknown")
+    # Try from file first, fallback to environment
+    return read_current_session().get("id") or os.environ.get("CLAUDE_SESSION_ID", "unknown")
 
 
 def get_current_session_tag():
     """Get current session tag (auto-generated or from env)."""
-    if SESSION_TAG_FILE.exists():
-        try:
-            stored_data = SESSION_TAG_FILE.read_text().strip()
-            if ":" in stored_data:
-                return stored_data.split(":", 1)[1]
-            return stored_data
-        except Exception:
-            pass
-    return os.environ.get("CLAUDE_SESSION_TAG", "main")
+    return read_current_session().get("tag") or os.environ.get("CLAUDE_SESSION_TAG", "main")
 
 
 def validate_task_changes(todos, session_id, session_tag):
     """Validate task status changes against claiming rules with dual-file locking."""
-    with locked_multi_json_rw(
-        (LOCKS_FILE, {}), (SESSIONS_FILE, {})
-    ) as entries:
-        locks, save_locks_fn = entries[0]
-        sessions, save_sessions_fn = entries[1]
-
-        warnings = []
-        updates = []
-        locks_changed = False
-        sessions_changed = False
-
-        for todo in todos:
-            content = todo.get("content", "")
-            status = todo.get("status", "")
-            task_id = generate_task_id(content)
-
-            # Check for in_progress claims
-            if status == "in_progress":
-                # Check if already claimed by another session
-                if task_id in locks:
-                    lock = locks[task_id]
-                    if lock.get("session_id") != session_id:
-                        other_tag = lock.get("session_tag", "unknown")
-                        warnings.append(
-                            f"CONFLICT: Task already claimed by @{other_tag}\n"
-                            f"  Task: {content[:50]}...\n"
-                            f"  Claimed at: {lock.get('claimed_at', 'unknown')}"
-                        )
-                        continue
-
-                # Claim the task
-                locks[task_id] = {
-                    "session_id": session_id,
-                    "session_tag": session_tag,
-                    "claimed_at": datetime.now().isoformat(),
-                    "task_content": content[:100]
-                }
-                locks_changed = True
-                updates.append(f"Claimed: {content[:40]}... (@{session_tag})")
-
-                # Update session's claimed tasks
-                if session_id in sessions:
-                    claimed = sessions[session_id].get("claimed_tasks", [])
-                    if task_id not in claimed:
-                        claimed.append(task_id)
-                        sessions[session_id]["claimed_tasks"] = claimed
-                        sessions_changed = True
-
-            # Check for completed tasks
-            elif status == "completed":
-                if task_id in locks:
-                    lock = locks[task_id]
-                    if lock.get("session_id") != session_id:
-                        other_tag = lock.get("session_tag", "unknown")
-                        warnings.append(
-                            f"WARNING: Completing task claimed by @{other_tag}\n"
-                            f"  Task: {content[:50]}..."
-                        )
-
-                    # Release the lock
-                    del locks[task_id]
-                    locks_changed = True
-
-                # Remove from session's claimed tasks
-                if session_id in sessions:
-                    claimed = sessions[session_id].get("claimed_tasks", [])
-                    if task_id in claimed:
-                        claimed.remove(task_id)
-                        sessions[session_id]["claimed_tasks"] = claimed
-                        sessions_changed = True
-
-        # Save only if changed
-        if locks_changed:
-            save_locks_fn(locks)
-        if sessions_changed:
-            save_sessions_fn(sessions)
+    # Hash all todos up front, separate from the lock-mutation loop
+    task_ids = list(map(generate_task_id, (todo.get("content", "") for todo in todos)))
+
+    # Dry run against an unlocked snapshot first. TodoWrite resends the whole
+    # list, so most calls only repeat claims and completions already recorded;
+    # those need neither file lock.
+    warnings, updates, locks_changed, sessions_changed = apply_task_changes(
+        todos, task_ids, load_locks(), load_sessions(), session_id, session_tag
+    )
+
+    if locks_changed or sessions_changed:
+        with locked_multi_json_rw(
+            (LOCKS_FILE, {}), (SESSIONS_FILE, {}), indent=False
+        ) as entries:
+            locks, save_locks_fn = entries[0]
+            sessions, save_sessions_fn = entries[1]
+
+            warnings, updates, locks_changed, sessions_changed = apply_task_changes(
+                todos, task_ids, locks, sessions, session_id, session_tag
+            )
+
+            # Save only if changed
+            if locks_changed:
+                save_locks_fn(locks)
+            if sessions_changed:
+                save_sessions_fn(sessions)
 
     # Report warnings (outside the lock)
     if warnings:
@@ -190,22 +127,111 @@ def validate_task_changes(todos, session_id, session_tag):
             print(f"[CLAIM] {u}")
 
 
+def apply_task_changes(todos, task_ids, locks, sessions, session_id, session_tag):
+    """
+    Apply claiming rules to locks and sessions in place.
+
+    Returns (warnings, updates, locks_changed, sessions_changed).
+    """
+    warnings = []
+    updates = []
+    locks_changed = False
+    sessions_changed = False
+
+    # All claims in one TodoWrite share a timestamp
+    now = datetime.now()
+    now_iso = now.isoformat()
+    now_ts = now.timestamp()
+
+    for todo, task_id in zip(todos, task_ids):
+        content = todo.get("content", "")
+        status = todo.get("status", "")
+
+        # Check for in_progress claims
+        if status == "in_progress":
+            # Check if already claimed by another session
+            if task_id in locks:
+                lock = locks[task_id]
+                if lock.get("session_id") != session_id:
+                    other_tag = lock.get("session_tag", "unknown")
+                    warnings.append(
+                        f"CONFLICT: Task already claimed by @{other_tag}\n"
+                        f"  Task: {content[:50]}...\n"
+                        f"  Claimed at: {lock.get('claimed_at', 'unknown')}"
+                    )
+                    continue
+            else:
+                # Claim the task (a claim this session already holds keeps its original time)
+                locks[task_id] = {
+                    "session_id": session_id,
+                    "session_tag": session_tag,
+                    "claimed_at": now_iso,
+                    "claimed_at_ts": now_ts,
+                    "task_content": content[:100]
+                }
+                locks_changed = True
+                updates.append(f"Claimed: {content[:40]}... (@{session_tag})")
+
+            # Update session's claimed tasks
+            if session_id in sessions:
+                claimed = sessions[session_id].get("claimed_tasks", [])
+                if task_id not in claimed:
+                    claimed.append(task_id)
+                    sessions[session_id]["claimed_tasks"] = claimed
+                    sessions_changed = True
+
+        # Check for completed tasks
+        elif status == "completed":
+            if task_id in locks:
+                lock = locks[task_id]
+                if lock.get("session_id") != session_id:
+                    other_tag = lock.get("session_tag", "unknown")
+                    warnings.append(
+                        f"WARNING: Completing task claimed by @{other_tag}\n"
+                        f"  Task: {content[:50]}..."
+                    )
+
+                # Release the lock
+                del locks[task_id]
+                locks_changed = True
+
+            # Remove from session's claimed tasks
+            if session_id in sessions:
+                claimed = sessions[session_id].get("claimed_tasks", [])
+                if task_id in claimed:
+                    claimed.remove(task_id)
+                    sessions[session_id]["claimed_tasks"] = claimed
+                    sessions_changed = True
+
+    return warnings, updates, locks_changed, sessions_changed
+
+
 def generate_task_id(content):
     """Generate a stable ID from task content."""
-    import hashlib
-    # Normalize: lowercase, strip whitespace, remove status markers
-    normalized = re.sub(r'^\[.*?\]\s*', '', content.lower().strip())
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    # Normalize: lowercase, remove a leading status marker like "[x]",
+    # collapse whitespace runs (str.split() also strips both ends)
+    normalized = content.lower().strip()
+    if normalized.startswith("["):
+        end = normalized.find("]")
+        if end != -1 and "\n" not in normalized[:end]:
+            normalized = normalized[end + 1:]
+    normalized = " ".join(normalized.split())
+    # 8-byte BLAKE2b digest: 16 hex chars (64-bit ID space) without truncation
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def load_locks():
     """Load task locks (read-only, no locking needed)."""
-    if not LOCKS_FILE.exists():
+    try:
+        return loads(LOCKS_FILE.read_bytes())
+    except Exception:
         return {}
+
+
+def load_sessions():
+    """Load sessions registry (read-only, no locking needed)."""
     try:
-        with open(LOCKS_FILE, encoding="utf-8") as f:
-            return json.load(f)
+        return loads(SESSIONS_FILE.read_bytes())
     except Exception:
         return {}
 
@@ -7,9 +7,14 @@ and prints a reminder.
 """
 import json
 import os
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.json_compat import loads
+
 SESSION_DIR = Path(".claude/session")
 WORK_QUEUE_FILE = SESSION_DIR / "work_queue.json"
 STARTUP_CONTEXT_FILE = SESSION_DIR / "worker_startup_context.json"
@@ -35,25 +40,22 @@ def main():
             f"{task_id}: {desc}... "
             f"Run /complete-task to mark it done, or it returns to 'available' after 30 min."
         )
-        # Output structured JSON for Stop hook protocol
-        print(json.dumps({"result": "block", "reason": reason}))
+        # Output structured JSON for Stop hook protocol (fixed shape, only reason varies)
+        print(f'{{"result": "block", "reason": {json.dumps(reason)}}}')
 
 
 def get_startup_task():
     """Get task from startup context if still valid."""
-    if not STARTUP_CONTEXT_FILE.exists():
-        return None
-
     try:
-        with open(STARTUP_CONTEXT_FILE, encoding="utf-8") as f:
-            context = json.load(f)
+        context = loads(STARTUP_CONTEXT_FILE.read_bytes())
 
         # Check if this is a recent context (within 4 hours)
-        timestamp = context.get("timestamp")
-        if timestamp:
-            ctx_time = datetime.fromisoformat(timestamp)
-            if (datetime.now() - ctx_time).total_seconds() > 4 * 3600:
-                return None  # Stale context
+        ctx_ts = context.get("timestamp_ts")
+        if ctx_ts is None and context.get("timestamp"):
+            # Contexts written before timestamp_ts existed
+            ctx_ts = datetime.fromisoformat(context["timestamp"]).timestamp()
+        if ctx_ts is not None and time.time() - ctx_ts > 4 * 3600:
+            return None  # Stale context
 
         task = context.get("selected_task")
         if task and task.get("status") != "completed":
@@ -66,19 +68,14 @@ def get_startup_task():
 
 def get_claimed_task_for_session(session_tag):
     """Get any task claimed by this session from work queue."""
-    if not WORK_QUEUE_FILE.exists():
-        return None
-
     try:
-        with open(WORK_QUEUE_FILE, encoding="utf-8") as f:
-            queue = json.load(f)
-
-        for task in queue.get("tasks", []):
-            if (task.get("status") == "claimed" and
-                task.get("claimed_by") == session_tag):
-                return task
+        queue = loads(WORK_QUEUE_FILE.read_bytes())
 
-        return None
+        return next(
+            (task for task in queue.get("tasks", [])
+             if task.get("claimed_by") == session_tag and task.get("status") == "claimed"),
+            None,
+        )
     except Exception:
         return None
 
@@ -8,16 +8,26 @@ STATE.md and DEVLOG.md to build a JSON cache that /resume-work can read quickly.
 Output: .claude/session/context_cache.json
 """
 import hashlib
-import json
+import os
 import re
 import subprocess
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.json_compat import dumps, loads
+
 CACHE_DIR = Path(".claude/session")
 CACHE_FILE = CACHE_DIR / "context_cache.json"
 LOCK_FILE = CACHE_DIR / "warmup.lock"
 HASH_FILE = CACHE_DIR / "source_hash.txt"
+STAT_FILE = CACHE_DIR / "source_stat.json"
+TASKS_CACHE_FILE = CACHE_DIR / "active_tasks_cache.json"
+
+# Files whose content decides whether the cache is stale
+SOURCE_FILES = ("STATE.md", "DEVLOG.md")
 
 # Session duration in seconds (5 minutes) - prevents repeated runs in same session
 SESSION_DURATION = 300
@@ -25,17 +35,32 @@ SESSION_DURATION = 300
 # Cache TTL in seconds (4 hours) - invalidate stale cache regardless of hash
 CACHE_TTL = 4 * 60 * 60  # 14400 seconds
 
+# Read size when hashing source files (1 MiB)
+HASH_CHUNK_SIZE = 1 << 20
+
+# STATE.md / DEVLOG.md patterns
+HANDOFF_RE = re.compile(r"## Handoff Notes\n(.*?)(?=\n## |\Z)", re.DOTALL)
+LAST_UPDATED_RE = re.compile(r"\*\*Last Updated:\*\*\s*(.+)")
+SESSION_ENDED_RE = re.compile(r"\*\*Session Ended:\*\*\s*(.+)")
+ACTIVE_ISSUES_HEADER = "| ID | Description | Status |"
+
+# Cap on active issues kept in the cache (bounds work on a long DEVLOG table)
+MAX_ACTIVE_ISSUES = 50
+# "Phase\s+(\d+)" also covers the plain "Phase N" form
+PHASE_RES = (
+    re.compile(r"\*\*Phase:\*\*\s*(\d+)"),
+    re.compile(r"Phase\s+(\d+)"),
+)
+
 
 def main():
     """Build context cache if needed."""
-    # Only run once per session (check lock file age)
-    if LOCK_FILE.exists():
-        try:
-            lock_age = datetime.now().timestamp() - LOCK_FILE.stat().st_mtime
-            if lock_age < SESSION_DURATION:
-                return  # Already warming/warmed this session
-        except Exception:
-            pass  # Lock file corrupted, continue
+    # Only run once per session (check lock file age) - a single stat
+    try:
+        if time.time() - LOCK_FILE.stat().st_mtime < SESSION_DURATION:
+            return  # Already warming/warmed this session
+    except OSError:
+        pass  # No lock yet (or unreadable), continue
 
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -46,47 +71,87 @@ def main():
         return  # Can't acquire lock, skip
 
     try:
-        # Check cache TTL first - invalidate if older than 4 hours
-        if CACHE_FILE.exists():
+        # Stat before hashing, so an edit made mid-hash is caught next run
+        fingerprint = source_fingerprint()
+        current_hash = None
+
+        try:
+            cache_age = time.time() - CACHE_FILE.stat().st_mtime
+        except OSError:
+            cache_age = None  # No cache yet, build it
+
+        # Check cache TTL first - invalidate if older than 4 hours.
+        # Within the TTL, cheapest check first: stat fingerprint, then content hash
+        if cache_age is not None and cache_age > CACHE_TTL:
+            print(f"Cache expired ({cache_age/3600:.1f}h old, TTL={CACHE_TTL/3600}h)")
+            # Continue to rebuild
+        elif cache_age is not None:
+            # Sources untouched since the last build: no need to read them
+            try:
+                if loads(STAT_FILE.read_bytes()) == fingerprint:
+                    return
+            except Exception:
+                pass  # Built before the sidecar existed
+
+            # Touched, but maybe not changed - compare content hashes
             try:
-                cache_age = datetime.now().timestamp() - CACHE_FILE.stat().st_mtime
-                if cache_age > CACHE_TTL:
-                    print(f"Cache expired ({cache_age/3600:.1f}h old, TTL={CACHE_TTL/3600}h)")
-                    # Continue to rebuild
-                else:
-                    # Check if sources changed (skip if cache is fresh and within TTL)
-                    current_hash = compute_source_hash()
-                    if HASH_FILE.exists():
-                        if HASH_FILE.read_text().strip() == current_hash:
-                            return  # Cache is still valid and within TTL
+                current_hash = compute_source_hash()
+                if HASH_FILE.read_text().strip() == current_hash:
+                    STAT_FILE.write_bytes(dumps(fingerprint))
+                    return  # Cache is still valid and within TTL
             except Exception:
-                pass  # Cache file issue, rebuild
+                pass  # No stored hash, rebuild
 
         # Compute hash for new cache
-        current_hash = compute_source_hash()
-
-        # Build cache
-        cache = {
-            "generated_at": datetime.now().isoformat(),
-            "handoff": extract_handoff_notes(),
-            "active_issues": extract_active_issues(),
-            "recent_commits": get_recent_commits(),
-            "current_phase": extract_current_phase(),
-            "uncommitted_files": get_uncommitted_files(),
-            "active_tasks": get_active_tasks(),
-            "task_claims": get_task_claims(),
-            "active_sessions": get_active_sessions(),
-            "file_locks": get_file_locks(),
-            "work_queue": get_work_queue_summary(),
-            "startup_context": get_startup_context(),
+        if current_hash is None:
+            current_hash = compute_source_hash()
+
+        # Imported here so the cache-still-valid returns stay cheap
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Sections read from coordination files in CACHE_DIR, with the value
+        # to use when the file is absent. One directory listing replaces a
+        # stat per file (and skips submitting those getters at all).
+        file_sections = {
+            "task_claims": ("task_locks.json", []),
+            "active_sessions": ("sessions.json", []),
+            "file_locks": ("file_locks.json", []),
+            "work_queue": ("work_queue.json", {"available": 0, "claimed": 0, "tasks": []}),
+            "startup_context": ("worker_startup_context.json", None),
         }
+        present = {entry.name for entry in os.scandir(CACHE_DIR)}
+
+        # Build cache - the sections are independent and mostly wait on file
+        # reads or git subprocesses, so gather them concurrently
+        sections = {
+            "handoff": extract_handoff_notes,
+            "active_issues": extract_active_issues,
+            "recent_commits": get_recent_commits,
+            "current_phase": extract_current_phase,
+            "uncommitted_files": get_uncommitted_files,
+            "active_tasks": get_active_tasks,
+            "task_claims": get_task_claims,
+            "active_sessions": get_active_sessions,
+            "file_locks": get_file_locks,
+            "work_queue": get_work_queue_summary,
+            "startup_context": get_startup_context,
+        }
+        cache = {"generated_at": datetime.now().isoformat()}
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {
+                key: executor.submit(fn) for key, fn in sections.items()
+                if key not in file_sections or file_sections[key][0] in present
+            }
+            for key in sections:
+                cache[key] = futures[key].result() if key in futures else file_sections[key][1]
 
         # Atomic write
         temp_file = CACHE_DIR / "context_cache.tmp"
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2)
+        with open(temp_file, "wb") as f:
+            f.write(dumps(cache, indent=True))
         temp_file.replace(CACHE_FILE)
         HASH_FILE.write_text(current_hash)
+        STAT_FILE.write_bytes(dumps(fingerprint))
 
         print(f"Context cache built: {CACHE_FILE}")
 
@@ -94,18 +159,31 @@ def main():
         print(f"Warning: Failed to build context cache: {e}")
 
 
+def source_fingerprint():
+    """Get [st_mtime_ns, st_size] per source file (None if missing)."""
+    fingerprint = []
+    for f in SOURCE_FILES:
+        try:
+            st = os.stat(f)
+            fingerprint.append([st.st_mtime_ns, st.st_size])
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+
 def compute_source_hash():
     """Compute hash of source files to detect changes."""
-    files = ["STATE.md", "DEVLOG.md"]
-    content = ""
-    for f in files:
-        path = Path(f)
-        if path.exists():
-            try:
-                content += path.read_text(encoding="utf-8", errors="replace")
-            except Exception:
-                pass
-    return hashlib.md5(content.encode()).hexdigest()[:16]
+    # Change detection only: BLAKE2b is faster than MD5 in hashlib, and
+    # streaming raw bytes never holds a whole file (or a decoded copy) in memory
+    h = hashlib.blake2b(digest_size=8)
+    for f in SOURCE_FILES:
+        try:
+            with open(f, "rb") as fh:
+                while chunk := fh.read(HASH_CHUNK_SIZE):
+                    h.update(chunk)
+        except Exception:
+            pass
+    return h.hexdigest()
 
 
 def extract_handoff_notes():
@@ -117,16 +195,14 @@ def extract_handoff_notes():
     try:
         content = state_file.read_text(encoding="utf-8", errors="replace")
         # Find Handoff Notes section
-        match = re.search(
-            r"## Handoff Notes\n(.*?)(?=\n## |\Z)", content, re.DOTALL
-        )
+        match = HANDOFF_RE.search(content)
         if match:
             notes = match.group(1).strip()
             # Extract key fields
             return {
                 "raw": notes[:2000],  # Truncate for cache size
-                "last_updated": extract_field(notes, r"\*\*Last Updated:\*\*\s*(.+)"),
-                "session_ended": extract_field(notes, r"\*\*Session Ended:\*\*\s*(.+)"),
+                "last_updated": extract_field(notes, LAST_UPDATED_RE),
+                "session_ended": extract_field(notes, SESSION_ENDED_RE),
             }
         return None
     except Exception:
@@ -134,8 +210,8 @@ def extract_handoff_notes():
 
 
 def extract_field(text, pattern):
-    """Extract a field value using regex pattern."""
-    match = re.search(pattern, text)
+    """Extract a field value using a compiled regex pattern."""
+    match = pattern.search(text)
     return match.group(1).strip() if match else None
 
 
@@ -147,16 +223,8 @@ def extract_active_issues():
 
     try:
         content = devlog_file.read_text(encoding="utf-8", errors="replace")
-        # Find active issues table (look for ID | Description | Status pattern)
-        match = re.search(
-            r"\| ID \| Description \| Status \|.*?\n\|[-| ]+\|\n((?:\|.*\n)*)",
-            content,
-        )
-        if not match:
-            return []
-
         issues = []
-        for line in match.group(1).strip().split("\n"):
+        for line in find_issue_rows(content):
             if "|" in line:
                 parts = [p.strip() for p in line.split("|")[1:-1]]
                 if len(parts) >= 3:
@@ -168,11 +236,40 @@ def extract_active_issues():
                             "description": parts[1][:100],  # Truncate
                             "status": parts[2] if len(parts) > 2 else "unknown",
                         })
+                        if len(issues) >= MAX_ACTIVE_ISSUES:
+                            break
         return issues
     except Exception:
         return []
 
 
+def find_issue_rows(content):
+    """
+    Return the row lines of the first Active Issues table in content.
+
+    A table is the ID | Description | Status header line, a |---|---|
+    separator line, then every following line that starts with "|".
+    Single linear pass over the lines - no regex backtracking.
+    """
+    lines = content.splitlines()
+    for i, line in enumerate(lines):
+        if ACTIVE_ISSUES_HEADER not in line:
+            continue
+        if i + 1 < len(lines) and is_table_separator(lines[i + 1]):
+            rows = []
+            for row in lines[i + 2:]:
+                if not row.startswith("|"):
+                    break
+                rows.append(row)
+            return rows
+    return []
+
+
+def is_table_separator(line):
+    """Check for a markdown table separator line like |---|---|."""
+    return len(line) >= 3 and line[0] == "|" and line[-1] == "|" and not line.strip("-| ")
+
+
 def extract_current_phase():
     """Extract current phase from STATE.md."""
     state_file = Path("STATE.md")
@@ -182,13 +279,8 @@ def extract_current_phase():
     try:
         content = state_file.read_text(encoding="utf-8", errors="replace")
         # Try different patterns
-        patterns = [
-            r"\*\*Phase:\*\*\s*(\d+)",
-            r"Phase\s+(\d+)",
-            r"Phase (\d+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, content)
+        for pattern in PHASE_RES:
+            match = pattern.search(content)
             if match:
                 return int(match.group(1))
         return None
@@ -202,11 +294,9 @@ def get_recent_commits():
         result = subprocess.run(
             ["git", "log", "--oneline", "-5"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
-        commits = result.stdout.strip()
-        return commits.split("\n") if commits else []
+        return result.stdout.decode("utf-8", "replace").splitlines()
     except Exception:
         return []
 
@@ -215,13 +305,24 @@ def get_uncommitted_files():
     """Get list of uncommitted files."""
     try:
         result = subprocess.run(
-            ["git", "status", "--short"],
+            # Background hook: don't take index.lock to refresh stat info
+            # -z: NUL-separated, unquoted paths (newlines in names can't split entries)
+            ["git", "--no-optional-locks", "status", "--short", "-z"],
             capture_output=True,
-            text=True,
             timeout=5,
         )
-        status = result.stdout.strip()
-        return status.split("\n") if status else []
+        records = iter(result.stdout.decode("utf-8", "replace").split("\0"))
+        files = []
+        for record in records:
+            if not record:
+                continue
+            # Renames/copies (index or worktree column) carry the original
+            # path as the next record
+            status = record[:2]
+            if "R" in status or "C" in status:
+                record = f"{record[:3]}{next(records, '')} -> {record[3:]}"
+            files.append(record)
+        return files
     except Exception:
         return []
 
@@ -230,18 +331,34 @@ def get_active_tasks():
     """Get active tasks from the persistent task list."""
     try:
         # Task list location based on CLAUDE_CODE_TASK_LIST_ID
-        import os
         task_list_id = os.environ.get("CLAUDE_CODE_TASK_LIST_ID", "my-project")
         tasks_dir = Path.home() / ".claude" / "tasks" / task_list_id
 
-        if not tasks_dir.exists():
+        # One stat per task file; only re-parse when any of them changed
+        try:
+            task_entries = sorted(
+                (entry for entry in os.scandir(tasks_dir)
+                 if entry.name.endswith(".json") and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
+        except OSError:
             return []
+        fingerprint = []
+        for entry in task_entries:
+            st = entry.stat()
+            fingerprint.append([entry.name, st.st_mtime_ns, st.st_size])
+
+        try:
+            cached = loads(TASKS_CACHE_FILE.read_bytes())
+            if cached.get("fingerprint") == fingerprint:
+                return cached["tasks"]
+        except Exception:
+            pass  # No usable cache, rescan
 
         tasks = []
-        for task_file in tasks_dir.glob("*.json"):
+        for entry in task_entries:
             try:
-                with open(task_file, encoding="utf-8") as f:
-                    task = json.load(f)
+                task = loads(Path(entry.path).read_bytes())
                 tasks.append({
                     "id": task.get("id"),
                     "subject": task.get("subject", "")[:80],
@@ -254,8 +371,14 @@ def get_active_tasks():
         # Sort by status: in_progress first, then pending
         status_order = {"in_progress": 0, "pending": 1, "completed": 2}
         tasks.sort(key=lambda t: status_order.get(t.get("status"), 99))
+        tasks = tasks[:20]  # Limit to 20 tasks
+
+        try:
+            TASKS_CACHE_FILE.write_bytes(dumps({"fingerprint": fingerprint, "tasks": tasks}))
+        except Exception:
+            pass
 
-        return tasks[:20]  # Limit to 20 tasks
+        return tasks
     except Exception:
         return []
 
@@ -263,12 +386,8 @@ def get_active_tasks():
 def get_task_claims():
     """Get current task claims from session coordination."""
     locks_file = CACHE_DIR / "task_locks.json"
-    if not locks_file.exists():
-        return []
-
     try:
-        with open(locks_file, encoding="utf-8") as f:
-            locks = json.load(f)
+        locks = loads(locks_file.read_bytes())
 
         claims = []
         for task_id, lock in locks.items():
@@ -287,12 +406,8 @@ def get_task_claims():
 def get_active_sessions():
     """Get currently active sessions."""
     sessions_file = CACHE_DIR / "sessions.json"
-    if not sessions_file.exists():
-        return []
-
     try:
-        with open(sessions_file, encoding="utf-8") as f:
-            sessions = json.load(f)
+        sessions = loads(sessions_file.read_bytes())
 
         now = datetime.now()
         active = []
@@ -318,12 +433,8 @@ def get_active_sessions():
 def get_file_locks():
     """Get current file locks."""
     file_locks_file = CACHE_DIR / "file_locks.json"
-    if not file_locks_file.exists():
-        return []
-
     try:
-        with open(file_locks_file, encoding="utf-8") as f:
-            locks = json.load(f)
+        locks = loads(file_locks_file.read_bytes())
 
         now = datetime.now()
         active = []
@@ -347,12 +458,8 @@ def get_file_locks():
 def get_work_queue_summary():
     """Get summary of work queue status."""
     work_queue_file = CACHE_DIR / "work_queue.json"
-    if not work_queue_file.exists():
-        return {"available": 0, "claimed": 0, "tasks": []}
-
     try:
-        with open(work_queue_file, encoding="utf-8") as f:
-            queue = json.load(f)
+        queue = loads(work_queue_file.read_bytes())
 
         tasks = queue.get("tasks", [])
         available = [t for t in tasks if t.get("status") == "available"]
@@ -384,12 +491,8 @@ def get_work_queue_summary():
 def get_startup_context():
     """Get worker startup context if this session was launched with a task."""
     startup_file = CACHE_DIR / "worker_startup_context.json"
-    if not startup_file.exists():
-        return None
-
     try:
-        with open(startup_file, encoding="utf-8") as f:
-            context = json.load(f)
+        context = loads(startup_file.read_bytes())
 
         # Only return if recent (within last 5 minutes)
         timestamp = context.get("timestamp")
@@ -20,6 +20,7 @@ SESSION_DATA_DIR = PROJECT_DIR / ".claude" / "data" / "sessions"
 SESSION_STATE_DIR = PROJECT_DIR / ".claude" / "session"
 HOOKS_DIR = PROJECT_DIR / ".claude" / "hooks"
 TTS_QUEUE_DIR = PROJECT_DIR / ".claude" / "data" / "tts_queue"
+SUMMARY_CACHE_DIR = PROJECT_DIR / ".claude" / "data" / "summary_cache"
 
 # ---------------------------------------------------------------------------
 # External configuration
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Current-session identity file shared by the session hooks.
+
+session_coordinator.py records the active session in a single JSON file:
+
+    .claude/session/current_session.json
+    {"id": "<session_id>", "tag": "<session_tag>", "issued_ts": <epoch seconds>}
+
+This replaces the older current_session_id.txt / current_session_tag.txt pair.
+The old files are still read as a fallback so sessions started by a previous
+version keep working for one release.
+
+Import via sys.path injection:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from utils.current_session import read_current_session
+"""
+import json
+import time
+from pathlib import Path
+
+from utils.platform_compat import atomic_write
+
+SESSION_DIR = Path(".claude/session")
+CURRENT_SESSION_FILE = SESSION_DIR / "current_session.json"
+
+# Legacy two-file scheme (read-only fallback, removed on cleanup)
+LEGACY_SESSION_ID_FILE = SESSION_DIR / "current_session_id.txt"
+LEGACY_SESSION_TAG_FILE = SESSION_DIR / "current_session_tag.txt"
+
+# Parsed current_session.json keyed by (st_mtime_ns, st_size), so repeated
+# lookups in one process cost a stat instead of an open + read + parse
+_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def read_current_session() -> dict:
+    """
+    Read the current session record. Returns empty dict if none exists.
+
+    Keys present depend on what has been issued: "id" and "issued_ts" once the
+    session ID exists, "tag" once a session tag has been assigned.
+    """
+    try:
+        st = CURRENT_SESSION_FILE.stat()
+    except OSError:
+        return _read_legacy_session()
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(CURRENT_SESSION_FILE)
+    if cached and cached[0] == key:
+        return dict(cached[1])
+
+    try:
+        data = json.loads(CURRENT_SESSION_FILE.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            _CACHE[CURRENT_SESSION_FILE] = (key, data)
+            return dict(data)
+    except Exception:
+        pass
+    return _read_legacy_session()
+
+
+def _read_legacy_session() -> dict:
+    """Read the pre-JSON current_session_id.txt / current_session_tag.txt files."""
+    data = {}
+    try:
+        session_id = LEGACY_SESSION_ID_FILE.read_text().strip()
+        if session_id:
+            data["id"] = session_id
+    except Exception:
+        pass
+
+    try:
+        stored_data = LEGACY_SESSION_TAG_FILE.read_text().strip()
+        # Format: session_id:tag
+        if ":" in stored_data:
+            stored_id, stored_tag = stored_data.split(":", 1)
+            if stored_id == data.get("id", stored_id):
+                data["tag"] = stored_tag
+        elif stored_data:
+            data["tag"] = stored_data
+    except Exception:
+        pass
+
+    return data
+
+
+def write_current_session(session_id: str, tag: str | None = None) -> None:
+    """Atomically record the current session ID (and tag, if assigned)."""
+    data = {"id": session_id, "issued_ts": time.time()}
+    if tag:
+        data["tag"] = tag
+    atomic_write(CURRENT_SESSION_FILE, json.dumps(data))
+
+
+def clear_current_session() -> None:
+    """Remove the current session record, including legacy files."""
+    for path in (CURRENT_SESSION_FILE, LEGACY_SESSION_ID_FILE, LEGACY_SESSION_TAG_FILE):
+        try:
+            path.unlink(missing_ok=True)
+        except Exception:
+            pass
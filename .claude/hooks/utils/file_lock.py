@@ -24,14 +24,26 @@ Usage (multiple files):
         # ... modify both ...
         save_locks(locks)
         save_sessions(sessions)
+
+Usage (non-JSON file, e.g. an append-only log):
+    from utils.file_lock import locked_file
+
+    with locked_file(EVENTS_FILE):
+        ...  # append to or rewrite the file
+
+Read-only access needs no lock (shared or otherwise): every write goes through
+a temp file + replace, so a plain read always sees one complete version of the
+file. Locking readers would only make them wait behind writers.
 """
-import json
 import os
 import sys
 import time
 from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
 
+from utils.json_compat import dumps, loads
+
 # ---------------------------------------------------------------------------
 # Platform-specific locking
 # ---------------------------------------------------------------------------
@@ -41,6 +53,7 @@ if _IS_WINDOWS:
     import msvcrt
 else:
     import fcntl
+    import threading
 
 
 # ---------------------------------------------------------------------------
@@ -49,25 +62,41 @@ else:
 
 def _acquire_lock(lock_path: Path, timeout: float = 4.0) -> int | None:
     """
-    Acquire an OS-level file lock with exponential backoff.
+    Acquire an OS-level file lock, waiting up to timeout seconds.
 
     Returns the file descriptor on success, or None on timeout (fail-open).
     """
+    fd = try_acquire_lock(lock_path, timeout)
+    if fd is None:
+        # Timeout — fail open
+        print(f"Warning: Could not acquire lock on {lock_path} within {timeout}s, proceeding without lock")
+    return fd
+
+
+def try_acquire_lock(lock_path: Path, timeout: float = 4.0) -> int | None:
+    """
+    Take an exclusive lock on lock_path, waiting up to timeout seconds.
+
+    Returns the locked file descriptor, or None on timeout. The caller
+    releases it (flock LOCK_UN / msvcrt LK_UNLCK on byte 0) and closes it.
+    """
     lock_path.parent.mkdir(parents=True, exist_ok=True)
+    if _IS_WINDOWS:
+        return _acquire_lock_polling(lock_path, timeout)
+    return _acquire_lock_blocking(lock_path, timeout)
+
+
+def _acquire_lock_polling(lock_path: Path, timeout: float) -> int | None:
+    """Windows: retry a non-blocking msvcrt lock with exponential backoff."""
     deadline = time.monotonic() + timeout
-    backoff = 0.05  # start at 50ms
+    backoff = 0.01  # start at 10ms; a short hold is usually over by the first retry
 
     while time.monotonic() < deadline:
         fd = None
         try:
             fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT)
-
-            if _IS_WINDOWS:
-                os.lseek(fd, 0, os.SEEK_SET)
-                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
-            else:
-                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
             return fd  # lock acquired
 
         except (OSError, IOError):
@@ -79,8 +108,56 @@ def _acquire_lock(lock_path: Path, timeout: float = 4.0) -> int | None:
             time.sleep(backoff)
             backoff = min(backoff * 1.5, 1.0)
 
-    # Timeout — fail open
-    print(f"Warning: Could not acquire lock on {lock_path} within {timeout}s, proceeding without lock")
+    return None
+
+
+def _acquire_lock_blocking(lock_path: Path, timeout: float) -> int | None:
+    """
+    POSIX: block in flock() so the lock is taken as soon as the holder releases it.
+
+    The blocking call runs on a daemon thread that the caller waits on with a
+    timeout. If the caller gives up first, the thread closes the descriptor
+    (dropping the lock) whenever its flock() eventually returns.
+    """
+    try:
+        fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT)
+    except OSError:
+        return None
+
+    # Uncontended case: no thread needed
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return fd
+    except OSError:
+        pass
+
+    done = threading.Event()
+    handoff = threading.Lock()
+    state = {"acquired": False, "abandoned": False}
+
+    def wait_for_lock():
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            acquired = True
+        except OSError:
+            acquired = False
+        with handoff:
+            if state["abandoned"]:
+                os.close(fd)  # closing also releases the lock
+                return
+            state["acquired"] = acquired
+            done.set()
+
+    threading.Thread(target=wait_for_lock, daemon=True).start()
+    done.wait(timeout)
+
+    with handoff:
+        if state["acquired"]:
+            return fd
+        if done.is_set():
+            os.close(fd)  # flock() failed outright
+        else:
+            state["abandoned"] = True
     return None
 
 
@@ -108,19 +185,30 @@ def _read_json(path: Path, default):
     if not path.exists():
         return default() if callable(default) else (default.copy() if isinstance(default, (dict, list)) else default)
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return loads(f.read())
     except Exception:
         return default() if callable(default) else (default.copy() if isinstance(default, (dict, list)) else default)
 
 
-def _write_json(path: Path, data) -> None:
-    """Write JSON atomically via temp file + replace."""
+def _stage_json(path: Path, data, indent: bool = True) -> Path | None:
+    """Write JSON to the temp file next to path. Returns the temp path, or None on failure."""
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_file = path.with_suffix(".tmp")
     try:
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with open(temp_file, "wb") as f:
+            f.write(dumps(data, indent=indent))
+        return temp_file
+    except Exception as e:
+        print(f"Warning: Failed to write {path}: {e}")
+        if temp_file.exists():
+            temp_file.unlink()
+        return None
+
+
+def _commit_json(temp_file: Path, path: Path) -> None:
+    """Move a staged temp file over its target."""
+    try:
         temp_file.replace(path)
     except Exception as e:
         print(f"Warning: Failed to write {path}: {e}")
@@ -128,12 +216,34 @@ def _write_json(path: Path, data) -> None:
             temp_file.unlink()
 
 
+def _write_json(path: Path, data, indent: bool = True) -> None:
+    """Write JSON atomically via temp file + replace."""
+    temp_file = _stage_json(path, data, indent)
+    if temp_file is not None:
+        _commit_json(temp_file, path)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 @contextmanager
-def locked_json_rw(path: Path, default=None, timeout: float = 4.0):
+def locked_file(path: Path, timeout: float = 4.0):
+    """
+    Context manager holding the same lock as locked_json_rw(path), for files
+    that aren't JSON documents (appended-to logs and the like).
+
+    Fails open on timeout, like the JSON helpers.
+    """
+    fd = _acquire_lock(path.with_name(path.name + ".lock"), timeout)
+    try:
+        yield
+    finally:
+        _release_lock(fd)
+
+
+@contextmanager
+def locked_json_rw(path: Path, default=None, timeout: float = 4.0, indent: bool = True):
     """
     Context manager for locked JSON read-modify-write.
 
@@ -144,6 +254,8 @@ def locked_json_rw(path: Path, default=None, timeout: float = 4.0):
         path: Path to the JSON file.
         default: Default value if file doesn't exist (dict, list, or callable).
         timeout: Max seconds to wait for lock. Fails open on timeout.
+        indent: Pretty-print with 2-space indent. Pass False for machine-only
+            state files to write compact JSON.
 
     Yields:
         (data, save) — data is the parsed JSON; save is a callable to write back.
@@ -156,29 +268,28 @@ def locked_json_rw(path: Path, default=None, timeout: float = 4.0):
 
     try:
         data = _read_json(path, default)
-        written = False
-
-        def save(new_data):
-            nonlocal written
-            _write_json(path, new_data)
-            written = True
-
-        yield data, save
+        yield data, partial(_write_json, path, indent=indent)
     finally:
         _release_lock(fd)
 
 
 @contextmanager
-def locked_multi_json_rw(*file_specs, timeout: float = 4.0):
+def locked_multi_json_rw(*file_specs, timeout: float = 4.0, indent: bool = True):
     """
     Context manager for locked multi-file JSON read-modify-write.
 
     Acquires locks on all files in sorted path order (prevents deadlocks),
     reads each, and yields a list of (data, save) tuples.
 
+    save() only records the new data. Files are written when the block exits
+    normally: every temp file is written first, then all are replaced back to
+    back, so a failure while serializing one file leaves all of them
+    untouched. If the block raises, nothing is written.
+
     Args:
         *file_specs: Each is (path, default) — a Path and its default value.
         timeout: Max seconds to wait for each lock.
+        indent: Pretty-print with 2-space indent (False writes compact JSON).
 
     Yields:
         List of (data, save) tuples, one per file_spec (in original order).
@@ -197,20 +308,29 @@ def locked_multi_json_rw(*file_specs, timeout: float = 4.0):
 
         # Read all files (in original order for caller convenience)
         results = []
+        pending = {}
         for path, default in file_specs:
             if default is None:
                 default = {}
             data = _read_json(path, default)
-
-            def make_save(p):
-                def save(new_data):
-                    _write_json(p, new_data)
-                return save
-
-            results.append((data, make_save(path)))
+            # save(new_data) just records pending[path] = new_data
+            results.append((data, partial(pending.__setitem__, path)))
 
         yield results
 
+        # Stage every pending write, then swap them in together
+        staged = []
+        for path, new_data in pending.items():
+            temp_file = _stage_json(path, new_data, indent)
+            if temp_file is None:
+                for other_temp, _ in staged:
+                    other_temp.unlink(missing_ok=True)
+                return
+            staged.append((temp_file, path))
+
+        for temp_file, path in staged:
+            _commit_json(temp_file, path)
+
     finally:
         # Release all locks in reverse acquisition order
         for fd in reversed(fds):
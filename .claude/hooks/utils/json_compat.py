@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Fast JSON encode/decode with graceful fallback.
+
+Uses orjson when it is installed (several times faster than the stdlib for
+the coordination files hooks re-read on every invocation) and falls back to
+the json module otherwise. Both backends work on bytes, so callers can read
+and write files in binary mode and skip the text-layer encode/decode.
+
+Import via sys.path injection:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from utils.json_compat import loads, dumps
+"""
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Raised by loads() on malformed input (orjson's error subclasses this too)
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by 2 spaces."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    # Match orjson's compact output (the stdlib default pads with spaces)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
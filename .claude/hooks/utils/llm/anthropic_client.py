@@ -16,9 +16,9 @@ Import via sys.path injection:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
     from utils.llm.anthropic_client import get_completion, get_agent_name
 """
-import os
 import random
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Ensure parent utils package is importable
@@ -35,21 +35,22 @@ except ImportError:
 
 # Import shared constants (single source of truth)
 from constants import LLM_MODEL as MODEL, LLM_MAX_TOKENS as MAX_TOKENS, LLM_TEMPERATURE as TEMPERATURE
+from constants import ANTHROPIC_API_KEY  # read once at import; hooks are short-lived
 
 # ---------------------------------------------------------------------------
 # Wordlist fallback for agent naming (zero-cost, zero-latency)
 # ---------------------------------------------------------------------------
-ADJECTIVES = [
+ADJECTIVES = (
     "swift", "bright", "bold", "calm", "keen", "sage", "true", "warm",
     "clear", "sharp", "deep", "fair", "free", "glad", "pure", "rare",
-]
-NOUNS = [
+)
+NOUNS = (
     "phoenix", "cipher", "nexus", "pulse", "forge", "prism", "atlas", "spark",
     "crest", "drift", "gleam", "haven", "orbit", "quest", "ridge", "valor",
-]
+)
 
 # Static completion messages (fallback when LLM unavailable)
-STATIC_COMPLETIONS = [
+STATIC_COMPLETIONS = (
     "Work complete!",
     "All done!",
     "Task finished!",
@@ -58,7 +59,13 @@ STATIC_COMPLETIONS = [
     "Done and dusted!",
     "That's a wrap!",
     "Finished up!",
-]
+)
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str):
+    """One client (and HTTP connection pool) per process for a given key."""
+    return anthropic.Anthropic(api_key=api_key)
 
 
 def get_completion(prompt: str, max_tokens: int = MAX_TOKENS) -> str | None:
@@ -70,12 +77,11 @@ def get_completion(prompt: str, max_tokens: int = MAX_TOKENS) -> str | None:
     if not ANTHROPIC_AVAILABLE:
         return None
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    if not api_key:
+    if not ANTHROPIC_API_KEY:
         return None
 
     try:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = _get_client(ANTHROPIC_API_KEY)
         msg = client.messages.create(
             model=MODEL,
             max_tokens=max_tokens,
@@ -101,7 +107,8 @@ def get_agent_name(session_context: str = "") -> str:
     )
 
     # Validate: must be a single alphabetic word, 3-20 chars
-    if result and len(result.split()) == 1 and result.isalpha() and 3 <= len(result) <= 20:
+    # (isalpha() already rejects any whitespace, so no split() needed)
+    if result and 3 <= len(result) <= 20 and result.isalpha():
         return result.capitalize()
 
     # Fallback: deterministic-ish wordlist combinator
@@ -130,4 +137,4 @@ def get_completion_message(engineer_name: str = "Developer") -> str:
 
 def is_available() -> bool:
     """Check if the Anthropic SDK is installed and an API key is present."""
-    return ANTHROPIC_AVAILABLE and bool(os.environ.get("ANTHROPIC_API_KEY", ""))
+    return ANTHROPIC_AVAILABLE and bool(ANTHROPIC_API_KEY)
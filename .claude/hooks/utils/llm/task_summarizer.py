@@ -11,13 +11,20 @@ Import via sys.path injection:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
     from utils.llm.task_summarizer import summarize_task, extract_task_context
 """
-import json
+import hashlib
 import sys
 from pathlib import Path
 
 # Ensure utils is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from constants import SUMMARY_CACHE_DIR
+from json_compat import JSONDecodeError, loads
 from llm.anthropic_client import get_completion
+from platform_compat import atomic_write
+
+# The first prompt sits near the top of a transcript; stop looking after this
+# many bytes so a huge transcript without one can't turn into a full scan
+CONTEXT_SCAN_MAX_BYTES = 2_000_000
 
 
 def summarize_task(transcript_excerpt: str) -> str:
@@ -33,13 +40,30 @@ def summarize_task(transcript_excerpt: str) -> str:
     if not transcript_excerpt or not transcript_excerpt.strip():
         return "Subagent completed."
 
+    # A single short line is already a usable summary; an API call can't improve on it
+    stripped = transcript_excerpt.strip()
+    if len(stripped) <= 80 and "\n" not in stripped:
+        return stripped
+
+    # Same excerpt, same prompt: reuse an earlier summary instead of an API call
+    excerpt = transcript_excerpt[:500]
+    cache_file = SUMMARY_CACHE_DIR / f"{hashlib.blake2b(excerpt.encode('utf-8'), digest_size=8).hexdigest()}.txt"
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
     result = get_completion(
         f"Summarize this completed task in under 20 words: "
-        f"{transcript_excerpt[:500]}. "
+        f"{excerpt}. "
         f"Reply with ONLY the summary, no quotes or prefix."
     )
 
     if result and len(result) < 120:
+        try:
+            atomic_write(cache_file, result)
+        except OSError:
+            pass
         return result
 
     # Fallback: truncate the excerpt
@@ -61,18 +85,19 @@ def extract_task_context(transcript_path: str) -> str:
         The first user prompt text (up to 200 chars), or empty string.
     """
     try:
-        path = Path(transcript_path)
-        if not path.exists():
-            return ""
-
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
+        with open(transcript_path, "rb", buffering=65536) as f:
+            scanned = 0
+            while scanned < CONTEXT_SCAN_MAX_BYTES and (line := f.readline()):
+                scanned += len(line)
+                # Only user entries or ones with a prompt field can match;
+                # skip parsing everything else (tool calls, results, ...)
+                if b'"user"' not in line and b'"prompt"' not in line:
                     continue
                 try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
+                    entry = loads(line)
+                except JSONDecodeError:
+                    continue
+                if not isinstance(entry, dict):
                     continue
 
                 # Check for user messages
@@ -25,6 +25,19 @@ IS_WINDOWS = sys.platform == "win32"
 IS_MACOS = sys.platform == "darwin"
 IS_LINUX = sys.platform.startswith("linux")
 
+if IS_WINDOWS:
+    # Bind the kernel32 calls once; ctypes.windll attribute lookups are not free
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenProcess.restype = wintypes.HANDLE
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
 
 def which(cmd: str) -> str | None:
     """Cross-platform command lookup. Always use this instead of shell `which`."""
@@ -72,12 +85,10 @@ def is_pid_alive(pid: int) -> bool:
     """
     if IS_WINDOWS:
         try:
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
             # PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
-            handle = kernel32.OpenProcess(0x1000, False, pid)
+            handle = _OpenProcess(0x1000, False, pid)
             if handle:
-                kernel32.CloseHandle(handle)
+                _CloseHandle(handle)
                 return True
             return False
         except Exception:
@@ -11,9 +11,10 @@ Import via sys.path injection:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
     from utils.stdin_parser import parse_hook_input
 """
-import json
 import sys
 
+from utils.json_compat import JSONDecodeError, loads
+
 
 def parse_hook_input() -> dict:
     """
@@ -30,10 +31,11 @@ def parse_hook_input() -> dict:
     See the Hook Protocol Reference in the integration plan for per-event schemas.
     """
     try:
-        data = sys.stdin.read()
+        # Raw bytes: no text-layer decode before the parser sees them
+        data = sys.stdin.buffer.read()
         if data.strip():
-            return json.loads(data)
-    except (json.JSONDecodeError, EOFError, OSError):
+            return loads(data)
+    except (JSONDecodeError, EOFError, OSError):
         pass
     return {}
 
@@ -8,27 +8,37 @@ Can be used as:
 
 If pyttsx3 is not installed, all calls silently return False.
 """
+import importlib.util
 import sys
 
-# Graceful import — TTS is optional
-try:
-    import pyttsx3
-    TTS_AVAILABLE = True
-except ImportError:
-    TTS_AVAILABLE = False
-
+# TTS is optional. pyttsx3 loads the platform speech bindings (SAPI/COM,
+# AppKit, espeak) on import, so it is only imported once something speaks.
+_tts_available = None  # unknown until is_available() is first called
 
 _engine = None
 
+# Last rate/volume pushed to the engine - setProperty crosses into the
+# platform driver (SAPI/NSSpeech/espeak), so skip it when nothing changed
+_applied_props = {}
+
 
 def _get_engine():
-    """Get or create the singleton pyttsx3 engine."""
+    """Get or create the singleton pyttsx3 engine (imports pyttsx3 on first use)."""
     global _engine
     if _engine is None:
+        import pyttsx3
         _engine = pyttsx3.init()
+        _applied_props.clear()
     return _engine
 
 
+def _set_property(engine, name: str, value) -> None:
+    """Set an engine property only if it differs from the last applied value."""
+    if _applied_props.get(name) != value:
+        engine.setProperty(name, value)
+        _applied_props[name] = value
+
+
 def speak(text: str, rate: int = 180, volume: float = 0.8) -> bool:
     """
     Speak text via pyttsx3.
@@ -41,12 +51,12 @@ def speak(text: str, rate: int = 180, volume: float = 0.8) -> bool:
     Returns:
         True if spoken successfully, False if degraded/failed.
     """
-    if not TTS_AVAILABLE or not text:
+    if not text or not is_available():
         return False
     try:
         engine = _get_engine()
-        engine.setProperty("rate", rate)
-        engine.setProperty("volume", volume)
+        _set_property(engine, "rate", rate)
+        _set_property(engine, "volume", volume)
         engine.say(text)
         engine.runAndWait()
         return True
@@ -55,8 +65,11 @@ def speak(text: str, rate: int = 180, volume: float = 0.8) -> bool:
 
 
 def is_available() -> bool:
-    """Check if TTS is available."""
-    return TTS_AVAILABLE
+    """Check if TTS is available (pyttsx3 is installed), without importing it."""
+    global _tts_available
+    if _tts_available is None:
+        _tts_available = importlib.util.find_spec("pyttsx3") is not None
+    return _tts_available
 
 
 # ---------------------------------------------------------------------------
@@ -11,12 +11,14 @@ Import via sys.path injection:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
     from utils.tts.tts_queue import acquire_tts_lock, release_tts_lock, cleanup_stale_locks
 """
-import json
 import os
+import struct
 import sys
 import time
 from pathlib import Path
 
+from utils.file_lock import try_acquire_lock
+
 # ---------------------------------------------------------------------------
 # Platform-specific locking
 # ---------------------------------------------------------------------------
@@ -33,7 +35,11 @@ else:
 _PROJECT_ROOT = Path(os.environ.get("CLAUDE_PROJECT_DIR", Path.cwd()))
 LOCK_DIR = _PROJECT_ROOT / ".claude" / "data" / "tts_queue"
 LOCK_FILE = LOCK_DIR / "tts.lock"
-LOCK_INFO_FILE = LOCK_DIR / "tts_lock_info.json"
+
+# Owner record kept inside LOCK_FILE, past the byte msvcrt locks:
+# pid (u64), timestamp (f64), agent_id (32 bytes, NUL-padded)
+_LOCK_INFO = struct.Struct("<Qd32s")
+_LOCK_INFO_OFFSET = 8
 
 # ---------------------------------------------------------------------------
 # Global lock state
@@ -41,47 +47,53 @@ LOCK_INFO_FILE = LOCK_DIR / "tts_lock_info.json"
 _lock_fd = None
 
 
-def _ensure_lock_dir() -> None:
-    """Create the lock directory if it doesn't exist."""
-    LOCK_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _write_lock_info(agent_id: str) -> None:
-    """Write lock owner info for stale detection."""
+def _put_lock_info(fd: int, record: bytes) -> None:
+    """Write the owner record into the held lock file in a single write."""
     try:
-        LOCK_INFO_FILE.write_text(
-            json.dumps({
-                "agent_id": agent_id,
-                "pid": os.getpid(),
-                "timestamp": time.time(),
-            }),
-            encoding="utf-8",
-        )
+        os.lseek(fd, _LOCK_INFO_OFFSET, os.SEEK_SET)  # no os.pwrite on Windows
+        os.write(fd, record)
     except OSError:
         pass
 
 
-def _read_lock_info() -> dict:
-    """Read lock info. Returns empty dict on failure."""
-    try:
-        if LOCK_INFO_FILE.exists():
-            return json.loads(LOCK_INFO_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        pass
-    return {}
+def _write_lock_info(agent_id: str) -> None:
+    """Write lock owner info for stale detection."""
+    _put_lock_info(_lock_fd, _LOCK_INFO.pack(
+        os.getpid(), time.time(), agent_id.encode("utf-8")[:32]
+    ))
 
 
 def _clear_lock_info() -> None:
-    """Clear the lock info file."""
+    """Zero the owner pid so a released lock is never mistaken for a stale one."""
+    _put_lock_info(_lock_fd, bytes(8))
+
+
+def _read_lock_info() -> dict:
+    """Read lock info. Returns empty dict on failure or if no owner is recorded."""
     try:
-        LOCK_INFO_FILE.write_text("{}", encoding="utf-8")
+        with open(LOCK_FILE, "rb") as f:
+            f.seek(_LOCK_INFO_OFFSET)
+            record = f.read(_LOCK_INFO.size)
     except OSError:
-        pass
+        return {}
+    if len(record) < _LOCK_INFO.size:
+        return {}
+    pid, timestamp, agent_id = _LOCK_INFO.unpack(record)
+    if not pid:
+        return {}  # Released cleanly
+    return {
+        "agent_id": agent_id.rstrip(b"\0").decode("utf-8", "ignore"),
+        "pid": pid,
+        "timestamp": timestamp,
+    }
 
 
 def acquire_tts_lock(agent_id: str = "main", timeout: float = 30.0) -> bool:
     """
-    Acquire cross-process TTS lock with exponential backoff.
+    Acquire cross-process TTS lock.
+
+    Blocks in flock() on POSIX (woken as soon as the holder releases);
+    polls msvcrt with exponential backoff on Windows.
 
     Args:
         agent_id: Identifier of the agent acquiring the lock.
@@ -91,40 +103,15 @@ def acquire_tts_lock(agent_id: str = "main", timeout: float = 30.0) -> bool:
         True if lock acquired, False if timed out.
     """
     global _lock_fd
-    _ensure_lock_dir()
-
-    deadline = time.monotonic() + timeout
-    backoff = 0.1  # start at 100ms
 
-    while time.monotonic() < deadline:
-        fd = None
-        try:
-            fd = os.open(str(LOCK_FILE), os.O_RDWR | os.O_CREAT)
-
-            if _IS_WINDOWS:
-                # msvcrt.locking locks byte ranges — seek to start, lock 1 byte
-                os.lseek(fd, 0, os.SEEK_SET)
-                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
-            else:
-                # fcntl.flock locks the entire file descriptor
-                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-
-            # Lock acquired
-            _lock_fd = fd
-            _write_lock_info(agent_id)
-            return True
-
-        except (OSError, IOError):
-            # Lock held by another process — close fd and retry
-            if fd is not None:
-                try:
-                    os.close(fd)
-                except OSError:
-                    pass
-            time.sleep(backoff)
-            backoff = min(backoff * 1.5, 1.0)  # cap at 1 second
+    fd = try_acquire_lock(LOCK_FILE, timeout)
+    if fd is None:
+        return False
 
-    return False
+    # Lock acquired
+    _lock_fd = fd
+    _write_lock_info(agent_id)
+    return True
 
 
 def release_tts_lock(agent_id: str = "main") -> None:
@@ -137,6 +124,10 @@ def release_tts_lock(agent_id: str = "main") -> None:
     global _lock_fd
 
     if _lock_fd is not None:
+        # Zero the pid first: a record left naming this (soon dead) process
+        # would make every later caller unlink the file once it aged, racing
+        # each other into separate lock inodes
+        _clear_lock_info()
         try:
             if _IS_WINDOWS:
                 # Seek to beginning before unlocking
@@ -149,15 +140,13 @@ def release_tts_lock(agent_id: str = "main") -> None:
             pass
         _lock_fd = None
 
-    _clear_lock_info()
-
 
 def cleanup_stale_locks(max_age_seconds: float = 60.0) -> bool:
     """
     Remove stale locks from dead processes.
 
     A lock is considered stale if:
-      1. The lock info file is older than max_age_seconds, AND
+      1. The owner record is older than max_age_seconds, AND
       2. The owning process (PID) is no longer alive.
 
     Args:
@@ -184,12 +173,11 @@ def cleanup_stale_locks(max_age_seconds: float = 60.0) -> bool:
     if pid and is_pid_alive(pid):
         return False  # Process still alive — lock is valid
 
-    # Stale lock — clean up
+    # Stale lock — clean up (the owner record goes with the file)
     try:
         LOCK_FILE.unlink(missing_ok=True)
     except OSError:
         pass
-    _clear_lock_info()
     return True
 
 
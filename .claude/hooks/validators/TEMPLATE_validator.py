@@ -66,19 +66,23 @@ def validate(target_path: str) -> dict:
         if os.path.getsize(target_path) == 0:
             issues.append("File is empty")
 
-        # Check 3: Read content
+        # Check 3: Stream the content line by line (one pass, constant memory)
+        has_todo = False
+        lines_with_trailing = []
         with open(target_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            for i, line in enumerate(f, 1):
+                line = line.rstrip('\n')
 
-        # Check 4: Example - no TODO comments
-        if "TODO" in content.upper():
-            issues.append("File contains unresolved TODO comments")
+                # Check 4: Example - no TODO comments (stop looking after the first)
+                if not has_todo and "TODO" in line.upper():
+                    has_todo = True
+
+                # Check 5: Example - no trailing whitespace
+                if line and line[-1].isspace():
+                    lines_with_trailing.append(i)
 
-        # Check 5: Example - no trailing whitespace
-        lines_with_trailing = [
-            i + 1 for i, line in enumerate(content.splitlines())
-            if line and line[-1].isspace()
-        ]
+        if has_todo:
+            issues.append("File contains unresolved TODO comments")
         if lines_with_trailing:
             issues.append(f"Lines with trailing whitespace: {lines_with_trailing}")
 
@@ -115,12 +119,14 @@ def log_result(target_path: str, issues: list):
         # Create log directory if it doesn't exist
         os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
+        # Build the whole record first so it lands in one append write
+        record = f"\n[{datetime.now()}] Target: {target_path}\nResult: {'FAIL' if issues else 'PASS'}\n"
+        if issues:
+            record += f"Issues: {issues}\n"
+        record += "-" * 40 + "\n"
+
         with open(LOG_FILE, "a", encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now()}] Target: {target_path}\n")
-            f.write(f"Result: {'FAIL' if issues else 'PASS'}\n")
-            if issues:
-                f.write(f"Issues: {issues}\n")
-            f.write("-" * 40 + "\n")
+            f.write(record)
     except Exception as e:
         # Logging failure shouldn't break validation
         print(f"Warning: Could not write to log file: {e}", file=sys.stderr)
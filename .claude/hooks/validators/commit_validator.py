@@ -16,7 +16,10 @@ import sys
 import os
 import re
 import subprocess
+import zlib
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
 
 LOG_FILE = ".claude/hooks/validators/commit_validator.log"
 
@@ -26,6 +29,22 @@ VALID_TYPES = [
     'perf', 'test', 'build', 'ci', 'chore', 'revert'
 ]
 
+# Format: type(scope): description
+# or: type: description
+# Scope can contain: letters, numbers, hyphens, commas (e.g., 1-A, 2-B,2-C, control-plane)
+CONVENTIONAL_RE = re.compile(r'^([a-z]+)(\([a-zA-Z0-9,\-]+\))?: .+')
+
+# Common non-imperative patterns (past tense and -ing forms in one scan)
+NON_IMPERATIVE_RE = re.compile(
+    r': (added|updated|fixed|removed|changed|created|deleted'
+    r'|adding|updating|fixing|removing|changing|creating|deleting)'
+)
+
+# Body line over 72 chars that isn't blank and isn't a trailer
+LONG_BODY_LINE_RE = re.compile(
+    r'^(?!Co-Authored-By:|Signed-off-by:)(?=.*\S).{73,}$', re.MULTILINE
+)
+
 def validate(target_path: str = None) -> dict:
     """
     Validate the most recent git commit message.
@@ -40,14 +59,7 @@ def validate(target_path: str = None) -> dict:
 
     try:
         # Get the most recent commit message
-        result = subprocess.run(
-            ['git', 'log', '-1', '--pretty=%B'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
-        commit_message = result.stdout.strip()
+        commit_message = get_latest_commit_message()
 
         if not commit_message:
             issues.append("Commit message is empty")
@@ -62,11 +74,7 @@ def validate(target_path: str = None) -> dict:
         body = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
 
         # Check 1: Conventional commit format
-        # Format: type(scope): description
-        # or: type: description
-        # Scope can contain: letters, numbers, hyphens, commas (e.g., 1-A, 2-B,2-C, control-plane)
-        conventional_pattern = re.compile(r'^([a-z]+)(\([a-zA-Z0-9,\-]+\))?: .+')
-        match = conventional_pattern.match(subject)
+        match = CONVENTIONAL_RE.match(subject)
 
         if not match:
             issues.append(
@@ -84,29 +92,23 @@ def validate(target_path: str = None) -> dict:
                 )
 
         # Check 2: Subject line length (recommended: 50 chars, max: 72)
-        if len(subject) > 72:
-            issues.append(f"Subject line too long ({len(subject)} chars, max 72)")
-        elif len(subject) > 50:
+        subject_len = len(subject)
+        if subject_len > 72:
+            issues.append(f"Subject line too long ({subject_len} chars, max 72)")
+        elif subject_len > 50:
             # Warning, not an error
-            issues.append(f"Warning: Subject line is {len(subject)} chars (recommended: <=50)")
+            issues.append(f"Warning: Subject line is {subject_len} chars (recommended: <=50)")
 
         # Check 3: Subject line should not end with period
         if subject.endswith('.'):
             issues.append("Subject line should not end with a period")
 
         # Check 4: Subject should be in imperative mood (basic check)
-        # Common non-imperative patterns
-        non_imperative_patterns = [
-            r': (added|updated|fixed|removed|changed|created|deleted)',
-            r': (adding|updating|fixing|removing|changing|creating|deleting)'
-        ]
-        for pattern in non_imperative_patterns:
-            if re.search(pattern, subject.lower()):
-                issues.append(
-                    "Subject should use imperative mood\n"
-                    "  Use 'add' not 'added/adding', 'fix' not 'fixed/fixing', etc."
-                )
-                break
+        if NON_IMPERATIVE_RE.search(subject.lower()):
+            issues.append(
+                "Subject should use imperative mood\n"
+                "  Use 'add' not 'added/adding', 'fix' not 'fixed/fixing', etc."
+            )
 
         # Check 5: Co-Authored-By line present (required for this template)
         if 'Co-Authored-By:' not in commit_message:
@@ -121,16 +123,14 @@ def validate(target_path: str = None) -> dict:
 
         # Check 7: Body lines should be wrapped at 72 characters
         if body:
-            long_lines = []
-            for i, line in enumerate(body.split('\n'), 2):
-                # Skip Co-Authored-By and other trailers
-                if line.startswith('Co-Authored-By:') or line.startswith('Signed-off-by:'):
-                    continue
-                if len(line) > 72 and line.strip():
-                    long_lines.append(f"Line {i}: {len(line)} chars")
+            # Only the first three are reported, so stop matching there
+            long_lines = [
+                f"Line {body.count(chr(10), 0, m.start()) + 2}: {m.end() - m.start()} chars"
+                for m in islice(LONG_BODY_LINE_RE.finditer(body), 3)
+            ]
 
             if long_lines:
-                issues.append(f"Body lines too long (max 72 chars):\n  " + "\n  ".join(long_lines[:3]))
+                issues.append(f"Body lines too long (max 72 chars):\n  " + "\n  ".join(long_lines))
 
     except subprocess.CalledProcessError:
         issues.append("No git repository or no commits found")
@@ -152,16 +152,62 @@ def validate(target_path: str = None) -> dict:
         "message": "Commit message validation passed"
     }
 
+def get_latest_commit_message() -> str:
+    """
+    Get the HEAD commit message.
+
+    Reads the loose commit object straight from .git when possible (a fresh
+    commit is always loose), avoiding a git fork+exec. Falls back to
+    `git log -1` for packed objects, worktrees, or any other layout.
+    """
+    message = read_head_message(Path(".git"))
+    if message is not None:
+        return message.strip()
+
+    result = subprocess.run(
+        ['git', 'log', '-1', '--pretty=%B'],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=5
+    )
+    return result.stdout.strip()
+
+
+def read_head_message(git_dir: Path):
+    """Read HEAD's message from a loose commit object. Returns None if not possible."""
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref: "):
+            # Loose ref only; packed refs fall back to git
+            sha = (git_dir / head[5:]).read_text(encoding="utf-8").strip()
+        else:
+            sha = head  # Detached HEAD
+
+        raw = zlib.decompress((git_dir / "objects" / sha[:2] / sha[2:]).read_bytes())
+        header, _, content = raw.partition(b"\0")
+        if not header.startswith(b"commit "):
+            return None
+
+        # Message follows the first blank line after the commit headers
+        _, sep, message = content.partition(b"\n\n")
+        if not sep:
+            return ""
+        return message.decode("utf-8", "replace")
+    except (OSError, ValueError, zlib.error):
+        return None
+
+
 def log_result(target_path: str, issues: list):
     """Log validation results for observability."""
     try:
         os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        record = f"\n[{datetime.now()}] Target: {target_path}\nResult: {'FAIL' if issues else 'PASS'}\n"
+        if issues:
+            record += f"Issues: {issues}\n"
+        record += "-" * 40 + "\n"
         with open(LOG_FILE, "a", encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now()}] Target: {target_path}\n")
-            f.write(f"Result: {'FAIL' if issues else 'PASS'}\n")
-            if issues:
-                f.write(f"Issues: {issues}\n")
-            f.write("-" * 40 + "\n")
+            f.write(record)
     except Exception:
         pass  # Don't break validation if logging fails
 
@@ -79,6 +79,46 @@ SAFE_ENV_PATTERNS = [
     r"\.env\.local\.example",
 ]
 
+# Leading run of literal characters in a pattern (word chars, / and -, or an
+# escaped punctuation mark), stopping short of a character made optional
+_LEADING_LITERAL_RE = re.compile(r"(?:\\b)?((?:[\w/-]|\\[^\w\s])+)(?![?*{])")
+
+# An escape, a character class, or a bare "|" (group 1): finds alternation
+# outside character classes
+_ALTERNATION_RE = re.compile(r"\\.|\[\^?\]?(?:\\.|[^\]\\])*\]|(\|)")
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Lowercased text that any match of pattern must contain.
+
+    Used as a cheap substring gate before running the regex. Falls back to
+    "" (always passes) for a pattern that doesn't start with a literal or
+    that uses alternation, where the leading literal only covers one branch.
+    """
+    if any(m.group(1) for m in _ALTERNATION_RE.finditer(pattern)):
+        return ""
+    match = _LEADING_LITERAL_RE.match(pattern)
+    if not match:
+        return ""
+    return re.sub(r"\\(.)", r"\1", match.group(1)).lower()
+
+
+# Compiled once per process: (literal, regex, description) with each pattern's flags baked in
+_COMPILED_PATTERNS = [
+    (_required_literal(entry[0]), re.compile(entry[0], entry[2] if len(entry) == 3 else 0), entry[1])
+    for entry in DANGEROUS_PATTERNS
+]
+_SAFE_ENV_RE = re.compile("|".join(SAFE_ENV_PATTERNS))
+
+# Smallest set of literals covering every pattern ("rmdir" is covered by "rm",
+# "delete" by "del"); a command containing none of them can't match anything
+_LITERALS = {literal for literal, _, _ in _COMPILED_PATTERNS}
+_TRIGGER_LITERALS = tuple(sorted(
+    literal for literal in _LITERALS
+    if not any(other != literal and other in literal for other in _LITERALS)
+))
+
 
 def main():
     """Check if the Bash command is dangerous."""
@@ -101,15 +141,17 @@ def main():
         sys.exit(0)
 
     # Check against dangerous patterns
+    # Quick reject: most commands (ls, cd, pytest, ...) hit no literal at all
+    command_lower = command.lower()
+    if not any(literal in command_lower for literal in _TRIGGER_LITERALS):
+        sys.exit(0)
+
     warnings = []
-    for pattern_tuple in DANGEROUS_PATTERNS:
-        if len(pattern_tuple) == 3:
-            pattern, description, flags = pattern_tuple
-        else:
-            pattern, description = pattern_tuple
-            flags = 0
-
-        match = re.search(pattern, command, flags)
+    for literal, regex, description in _COMPILED_PATTERNS:
+        # Most commands contain none of the literals, so most regexes never run
+        if literal not in command_lower:
+            continue
+        match = regex.search(command)
         if match:
             # For .env-related warnings, check if the specific matched segment
             # is a safe variant (e.g., .env.sample). Per-match, not per-command,
@@ -118,7 +160,7 @@ def main():
                 match_start = max(0, match.start() - 5)
                 match_end = min(len(command), match.end() + 20)
                 context = command[match_start:match_end]
-                if any(re.search(p, context) for p in SAFE_ENV_PATTERNS):
+                if _SAFE_ENV_RE.search(context):
                     continue
             warnings.append(description)
 
@@ -25,16 +25,26 @@ EXAMPLE INVARIANTS:
   - Component isolation rules
 """
 
+import atexit
+import hashlib
+import json
 import sys
 import os
 import re
+import tempfile
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 # Log file for this validator
 LOG_FILE = ".claude/hooks/validators/invariant_validator.log"
 
+# Per-file results, reused while a file's mtime/size and the invariants are unchanged
+CACHE_FILE = ".claude/hooks/validators/invariant_cache.json"
+
 # =============================================================================
 # CONFIGURE YOUR INVARIANTS HERE
 # =============================================================================
@@ -75,6 +85,9 @@ DEFAULT_EXTENSIONS = {'.py', '.js', '.ts', '.jsx', '.tsx', '.go', '.rs', '.java'
 # Directories to skip
 SKIP_DIRS = {'node_modules', 'venv', '.venv', '__pycache__', '.git', 'dist', 'build', 'target', '.next'}
 
+# validate_all scans stale files on a process pool once there are at least this many
+PARALLEL_MIN_FILES = 64
+
 
 # =============================================================================
 # VALIDATION LOGIC (Usually no need to modify below this line)
@@ -102,13 +115,53 @@ def matches_component(file_path: str, components: List[str]) -> bool:
 
     path_str = str(file_path).replace("\\", "/")
 
-    for component in components:
-        # Convert glob-like pattern to regex
-        pattern = component.replace("*", ".*").replace("/", r"[\\/]")
-        if re.search(pattern, path_str, re.IGNORECASE):
-            return True
+    return any(_component_regex(component).search(path_str) for component in components)
+
+
+@lru_cache(maxsize=None)
+def _component_regex(component: str) -> re.Pattern:
+    """Convert a glob-like component pattern to a compiled regex (once per pattern)."""
+    return re.compile(component.replace("*", ".*").replace("/", r"[\\/]"), re.IGNORECASE)
 
-    return False
+
+def _compiled_patterns(invariant: Dict) -> List:
+    """Compile an invariant's (regex, message) patterns on first use and keep them on it."""
+    compiled = invariant.get("_compiled")
+    if compiled is None:
+        compiled = invariant["_compiled"] = [
+            (re.compile(pattern, re.IGNORECASE), message)
+            for pattern, message in invariant.get("patterns", [])
+        ]
+    return compiled
+
+
+# Backreferences and conditionals would point at the wrong group once patterns
+# are joined; \A / \Z mean "start/end of line" per line but "start/end of file"
+# in one scan; lookarounds would see the neighbouring line's newline
+_UNJOINABLE_RE = re.compile(r"\\[1-9AZz]|\(\?P=|\(\?\(|\(\?<?[=!]")
+
+
+def _combined_regex(invariant: Dict) -> Optional[re.Pattern]:
+    """
+    One alternation of all of an invariant's patterns, used to find candidate lines.
+
+    Compiled with MULTILINE so ^ and $ still match at every line. None when
+    the patterns can't be safely joined (backreferences, conditionals, \A/\Z,
+    lookarounds, or the alternation fails to compile); every line is then a
+    candidate.
+    """
+    if "_combined" not in invariant:
+        patterns = [pattern for pattern, _ in invariant.get("patterns", [])]
+        combined = None
+        if patterns and not any(_UNJOINABLE_RE.search(p) for p in patterns):
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{p})" for p in patterns), re.IGNORECASE | re.MULTILINE
+                )
+            except re.error:
+                pass
+        invariant["_combined"] = combined
+    return invariant["_combined"]
 
 
 def get_file_extension(file_path: str) -> str:
@@ -130,22 +183,157 @@ def check_invariant(content: str, lines: List[str], invariant: Dict, file_path:
     if not matches_component(file_path, invariant.get("components", ["*"])):
         return issues
 
+    # One combined scan over the whole file finds the few lines any pattern
+    # can match; the individual patterns then only run on those
+    combined = _combined_regex(invariant)
+    if combined is None:
+        line_numbers = range(1, len(lines) + 1)
+    else:
+        matches = list(combined.finditer("\n".join(lines)))
+        if not matches:
+            return issues
+        # Offset of each line's first character; bisect maps a match offset to its line
+        line_starts = list(accumulate((len(line) + 1 for line in lines), initial=0))
+        line_numbers = set()
+        for m in matches:
+            # A match may run across lines (e.g. [^'"]+) - all of them are candidates
+            first = bisect_right(line_starts, m.start())
+            last = bisect_right(line_starts, max(m.end() - 1, m.start()))
+            line_numbers.update(range(first, min(last, len(lines)) + 1))
+        line_numbers = sorted(line_numbers)
+
+    candidates = []
+    for i in line_numbers:
+        line = lines[i - 1]
+        # Skip comments (basic detection; only leading whitespace matters)
+        if line.lstrip().startswith(("#", "//", "/*")):
+            continue
+        candidates.append((i, line))
+
     # Check patterns
-    for pattern, message in invariant.get("patterns", []):
-        for i, line in enumerate(lines, 1):
-            # Skip comments (basic detection)
-            stripped = line.strip()
-            if stripped.startswith("#") or stripped.startswith("//") or stripped.startswith("/*"):
-                continue
-
-            if re.search(pattern, line, re.IGNORECASE):
-                severity = invariant.get("severity", "error")
-                inv_id = invariant.get("id", "INV-?")
+    severity = invariant.get("severity", "error")
+    inv_id = invariant.get("id", "INV-?")
+    for regex, message in _compiled_patterns(invariant):
+        for i, line in candidates:
+            if regex.search(line):
                 issues.append(f"{inv_id} (Line {i}, {severity}): {message}")
 
     return issues
 
 
+_cache = None
+_cache_dirty = False
+
+
+def _config_key() -> str:
+    """Hash of everything besides file content that decides a file's issues."""
+    config = [
+        {key: value for key, value in invariant.items() if not key.startswith("_")}
+        for invariant in INVARIANTS
+    ]
+    raw = json.dumps([config, DEFAULT_EXTENSIONS], sort_keys=True, default=sorted)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _load_cache() -> dict:
+    """Load the result cache once per process, starting fresh if the invariants changed."""
+    global _cache
+    if _cache is None:
+        config = _config_key()
+        try:
+            with open(PROJECT_ROOT / CACHE_FILE, "rb") as f:
+                cache = json.loads(f.read())
+        except (OSError, ValueError):
+            cache = None
+        if not isinstance(cache, dict) or cache.get("config") != config:
+            cache = {"config": config, "files": {}}
+        _cache = cache
+    return _cache
+
+
+def _cached_issues(cache_key: str, st: os.stat_result) -> Optional[List[str]]:
+    """A file's cached issues if its mtime and size still match, else None."""
+    cached = _load_cache()["files"].get(cache_key)
+    if cached and cached[:2] == [st.st_mtime_ns, st.st_size]:
+        return list(cached[2])
+    return None
+
+
+def _store_cached_issues(cache_key: str, st: os.stat_result, issues: List[str]) -> None:
+    """Record a file's issues; the cache is written once, when the process exits."""
+    global _cache_dirty
+    _load_cache()["files"][cache_key] = [st.st_mtime_ns, st.st_size, issues]
+    if not _cache_dirty:
+        _cache_dirty = True
+        atexit.register(_save_cache)
+
+
+def _save_cache() -> None:
+    """
+    Write the result cache atomically via temp file + replace.
+
+    Hooks run in parallel, so each process stages into its own temp file.
+    """
+    cache_path = PROJECT_ROOT / CACHE_FILE
+    temp_file = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=cache_path.stem + ".", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(_cache))
+        os.replace(temp_file, cache_path)
+    except OSError:
+        if temp_file is not None:
+            try:
+                os.unlink(temp_file)
+            except OSError:
+                pass
+
+
+def _is_test_path(path_str: str) -> bool:
+    """Test files are exempt from invariants (path_str uses forward slashes)."""
+    return "/tests/" in path_str or "/test/" in path_str or "_test." in path_str or ".test." in path_str
+
+
+def _skip_reason(target_path: str) -> Optional[str]:
+    """
+    Why target_path is exempt from invariants, or None if it isn't.
+
+    Only the part of the path inside PROJECT_ROOT is checked, so a project
+    checked out under e.g. /build/ or /tmp/test/ isn't skipped wholesale.
+    """
+    path_str = os.path.abspath(target_path)
+    try:
+        relative = os.path.relpath(path_str, PROJECT_ROOT)
+        if not relative.startswith(".."):
+            path_str = relative
+    except ValueError:
+        pass  # Different drive on Windows - keep the absolute path
+    # Leading "/" so a top-level directory matches "/{skip_dir}/" too
+    path_str = "/" + path_str.replace("\\", "/").lstrip("/")
+
+    if any(f"/{skip_dir}/" in path_str for skip_dir in SKIP_DIRS):
+        return "excluded directory"
+    if _is_test_path(path_str):
+        return "test file"
+    return None
+
+
+def _scan_file(target_path: str) -> List[str]:
+    """Read a file and check it against every invariant."""
+    with open(target_path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+
+    lines = content.splitlines()
+
+    issues = []
+    for invariant in INVARIANTS:
+        issues.extend(check_invariant(content, lines, invariant, target_path))
+    return issues
+
+
 def validate(target_path: str) -> dict:
     """
     Validate a file against all defined invariants.
@@ -165,39 +353,30 @@ def validate(target_path: str) -> dict:
             "message": f"No invariants configured. See invariant_validator.py to add project invariants."
         }
 
-    # Skip files in excluded directories
-    path_str = str(target_path).replace("\\", "/")
-    for skip_dir in SKIP_DIRS:
-        if f"/{skip_dir}/" in path_str or path_str.startswith(f"{skip_dir}/"):
-            return {
-                "valid": True,
-                "message": f"Skipped (excluded directory): {os.path.basename(target_path)}"
-            }
-
-    # Skip test files
-    if "/tests/" in path_str or "/test/" in path_str or "_test." in path_str or ".test." in path_str:
+    # Skip files in excluded directories and test files
+    skip_reason = _skip_reason(target_path)
+    if skip_reason:
         return {
             "valid": True,
-            "message": f"Skipped (test file): {os.path.basename(target_path)}"
+            "message": f"Skipped ({skip_reason}): {os.path.basename(target_path)}"
         }
 
     try:
-        # Check file exists
-        if not os.path.exists(target_path):
+        # Check file exists (the same stat decides whether the cached result still holds)
+        try:
+            st = os.stat(target_path)
+        except OSError:
             issues.append(f"File not found: {target_path}")
             log_result(target_path, issues)
             return {"valid": False, "message": f"Validation failed: {issues[0]}"}
 
-        # Read content
-        with open(target_path, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-
-        lines = content.splitlines()
-
-        # Check each invariant
-        for invariant in INVARIANTS:
-            inv_issues = check_invariant(content, lines, invariant, target_path)
-            issues.extend(inv_issues)
+        cache_key = os.path.abspath(target_path)
+        cached = _cached_issues(cache_key, st)
+        if cached is not None:
+            issues = cached
+        else:
+            issues = _scan_file(target_path)
+            _store_cached_issues(cache_key, st, issues)
 
     except Exception as e:
         issues.append(f"Validation error: {str(e)}")
@@ -242,20 +421,18 @@ def validate_all() -> dict:
         }
 
     # Find all source files
-    for ext in DEFAULT_EXTENSIONS:
-        for source_file in PROJECT_ROOT.rglob(f"*{ext}"):
-            # Skip excluded directories
-            path_str = str(source_file).replace("\\", "/")
-            if any(f"/{skip}/" in path_str for skip in SKIP_DIRS):
-                continue
+    source_files = list(_iter_source_files(PROJECT_ROOT))
+
+    _prescan_in_parallel(source_files)
 
-            result = validate(str(source_file))
-            files_checked += 1
+    for source_file in source_files:
+        result = validate(source_file)
+        files_checked += 1
 
-            if result["valid"]:
-                files_passed += 1
-            else:
-                all_issues.append(result["message"])
+        if result["valid"]:
+            files_passed += 1
+        else:
+            all_issues.append(result["message"])
 
     # Summary
     if all_issues:
@@ -269,19 +446,77 @@ def validate_all() -> dict:
     }
 
 
+def _iter_source_files(root: Path):
+    """
+    Yield source files under root in a single walk.
+
+    Excluded directories are pruned by name, so node_modules, .git, venvs
+    and the like are never descended into.
+    """
+    extensions = tuple(DEFAULT_EXTENSIONS)
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(extensions):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _prescan_file(target_path: str) -> Optional[List[str]]:
+    """Pool worker: one file's issues, or None if it couldn't be checked."""
+    try:
+        return _scan_file(target_path)
+    except Exception:
+        return None  # validate() rescans it and reports the error
+
+
+def _prescan_in_parallel(source_files: List[str]) -> None:
+    """
+    Scan the files whose cached result is stale across a process pool.
+
+    Results land in the result cache, so the sequential validate() pass that
+    follows (which also does all the logging) just reads them back. Small
+    batches are left to that pass: starting workers would cost more than it saves.
+    """
+    stale = []
+    for path in source_files:
+        if _skip_reason(path):
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if _cached_issues(os.path.abspath(path), st) is None:
+            stale.append((path, st))
+
+    if len(stale) < PARALLEL_MIN_FILES:
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(_prescan_file, [path for path, _ in stale], chunksize=32)
+        for (path, st), issues in zip(stale, results):
+            if issues is not None:
+                _store_cached_issues(os.path.abspath(path), st, issues)
+
+
 def log_result(target_path: str, issues: list):
     """Log validation results for observability."""
     try:
         log_path = PROJECT_ROOT / LOG_FILE
         os.makedirs(log_path.parent, exist_ok=True)
 
+        record = f"\n[{datetime.now()}] Target: {target_path}\nResult: {'FAIL' if issues else 'PASS'}\n"
+        record += "".join(f"  - {issue}\n" for issue in issues)
+        record += "-" * 60 + "\n"
         with open(log_path, "a", encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now()}] Target: {target_path}\n")
-            f.write(f"Result: {'FAIL' if issues else 'PASS'}\n")
-            if issues:
-                for issue in issues:
-                    f.write(f"  - {issue}\n")
-            f.write("-" * 60 + "\n")
+            f.write(record)
     except Exception as e:
         print(f"Warning: Could not write to log file: {e}", file=sys.stderr)
 
@@ -18,6 +18,9 @@ from collections import Counter
 
 LOG_FILE = ".claude/hooks/validators/json_validator.log"
 
+# Files above this size are streamed with ijson (if installed) instead of loaded whole
+STREAM_THRESHOLD = 1_000_000  # 1MB
+
 def validate(target_path: str) -> dict:
     """
     Validate JSON file for syntax and common issues.
@@ -53,33 +56,46 @@ def validate(target_path: str) -> dict:
                 "message": "Resolve these errors:\n- JSON file is empty"
             }
 
-        # Check 3: Valid JSON syntax
-        with open(target_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            issues.append(f"Invalid JSON syntax at line {e.lineno}, column {e.colno}: {e.msg}")
-            log_result(target_path, issues)
-            return {
-                "valid": False,
-                "message": f"Resolve these errors in {os.path.basename(target_path)}:\n- {issues[0]}"
-            }
+        # Check 4: Detect duplicate keys (collected during the same parse as check 3)
+        duplicate_issues = []
 
-        # Check 4: Detect duplicate keys (re-parse with object_pairs_hook)
         def check_duplicate_keys(pairs):
             keys = [key for key, value in pairs]
             duplicates = [key for key, count in Counter(keys).items() if count > 1]
             if duplicates:
-                issues.append(f"Duplicate keys found: {', '.join(duplicates)}")
+                duplicate_issues.append(f"Duplicate keys found: {', '.join(duplicates)}")
             return dict(pairs)
 
-        with open(target_path, 'r', encoding='utf-8') as f:
-            json.load(f, object_pairs_hook=check_duplicate_keys)
+        # Check 3: Valid JSON syntax - one parse covers both checks.
+        # Large files are streamed when ijson is available, so memory stays flat.
+        streamed = None
+        if os.path.getsize(target_path) > STREAM_THRESHOLD:
+            streamed = check_json_streaming(target_path)
+
+        if streamed is not None:
+            syntax_error, duplicate_issues = streamed
+        else:
+            syntax_error = None
+            with open(target_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+
+            try:
+                json.loads(content, object_pairs_hook=check_duplicate_keys)
+            except json.JSONDecodeError as e:
+                syntax_error = f"Invalid JSON syntax at line {e.lineno}, column {e.colno}: {e.msg}"
+
+        if syntax_error:
+            issues.append(syntax_error)
+            log_result(target_path, issues)
+            return {
+                "valid": False,
+                "message": f"Resolve these errors in {os.path.basename(target_path)}:\n- {issues[0]}"
+            }
+
+        issues.extend(duplicate_issues)
 
         # Check 5: Warn if file is very large
-        if os.path.getsize(target_path) > 1_000_000:  # 1MB
+        if os.path.getsize(target_path) > STREAM_THRESHOLD:
             issues.append(f"Warning: Large JSON file ({os.path.getsize(target_path) // 1024} KB)")
 
     except Exception as e:
@@ -100,16 +116,48 @@ def validate(target_path: str) -> dict:
         "message": f"JSON validation passed for {os.path.basename(target_path)}"
     }
 
+def check_json_streaming(target_path: str):
+    """
+    Check syntax and duplicate keys from a stream of parse events (for large files).
+
+    Returns (syntax_error, duplicate_issues) - syntax_error is None when the
+    file parses - or None if ijson isn't installed.
+    """
+    try:
+        import ijson
+    except ImportError:
+        return None
+
+    duplicate_issues = []
+    key_counts = []  # key -> count for each object still open
+    try:
+        with open(target_path, 'rb') as f:
+            for event, value in ijson.basic_parse(f):
+                if event == 'map_key':
+                    counts = key_counts[-1]
+                    counts[value] = counts.get(value, 0) + 1
+                elif event == 'start_map':
+                    key_counts.append({})
+                elif event == 'end_map':
+                    # Reported as each object closes, same order as object_pairs_hook
+                    duplicates = [key for key, count in key_counts.pop().items() if count > 1]
+                    if duplicates:
+                        duplicate_issues.append(f"Duplicate keys found: {', '.join(duplicates)}")
+    except ijson.JSONError as e:
+        return f"Invalid JSON syntax: {e}", []
+
+    return None, duplicate_issues
+
 def log_result(target_path: str, issues: list):
     """Log validation results for observability."""
     try:
         os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        record = f"\n[{datetime.now()}] Target: {target_path}\nResult: {'FAIL' if issues else 'PASS'}\n"
+        if issues:
+            record += f"Issues: {issues}\n"
+        record += "-" * 40 + "\n"
         with open(LOG_FILE, "a", encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now()}] Target: {target_path}\n")
-            f.write(f"Result: {'FAIL' if issues else 'PASS'}\n")
-            if issues:
-                f.write(f"Issues: {issues}\n")
-            f.write("-" * 40 + "\n")
+            f.write(record)
     except Exception:
         pass  # Don't break validation if logging fails
 
@@ -126,12 +126,12 @@ def log_result(target_path: str, issues: list):
     """Log validation results for observability."""
     try:
         os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        record = f"\n[{datetime.now()}] Target: {target_path}\nResult: {'FAIL' if issues else 'PASS'}\n"
+        if issues:
+            record += f"Issues: {issues}\n"
+        record += "-" * 40 + "\n"
         with open(LOG_FILE, "a", encoding='utf-8') as f:
-            f.write(f"\n[{datetime.now()}] Target: {target_path}\n")
-            f.write(f"Result: {'FAIL' if issues else 'PASS'}\n")
-            if issues:
-                f.write(f"Issues: {issues}\n")
-            f.write("-" * 40 + "\n")
+            f.write(record)
     except Exception:
         pass  # Don't break validation if logging fails
 
@@ -287,9 +287,11 @@ def create_startup_context(session_tag, selected_task=None, custom_task=None):
     Returns:
         A prompt string to pass to Claude, or None if no task.
     """
+    now = datetime.now()
     context = {
         "session_tag": session_tag,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
+        "timestamp_ts": now.timestamp(),
         "selected_task": selected_task,
         "custom_task": custom_task,
     }